@@ -0,0 +1,21 @@
+"""
+Shared setup for the model selection examples.
+
+Loads environment variables from the nearest .env file once and provides the
+output directory helper used by every example.
+"""
+
+from pathlib import Path
+from dotenv import load_dotenv
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# Load environment variables (does not override variables already set)
+load_dotenv(override=False)
+
+
+def out_dir(*parts: str) -> str:
+    """Return (and create) the output directory for an example run."""
+    path = BASE_DIR.joinpath("output", *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return str(path)
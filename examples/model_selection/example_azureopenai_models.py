@@ -21,11 +21,9 @@ Required extra_kwargs for Azure OpenAI:
 
 from syda.generate import SyntheticDataGenerator
 from syda.schemas import ModelConfig
-import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+import asyncio
+import httpx
+from _common import out_dir
 
 # Define schema for healthcare data
 schemas = {
@@ -60,46 +58,79 @@ prompts = {
     'Appointment': 'Generate realistic appointment records with various appointment types, realistic scheduling patterns, and appropriate durations.'
 }
 
-# Example 1: Azure OpenAI with GPT-4o
-print("--------------Testing Azure OpenAI GPT-4o----------------")
-
-# Configuration for Azure OpenAI GPT-4o
-model_config_gpt4o = ModelConfig(
-    provider="azureopenai",
-    model_name="gpt-4o",  # This should match your deployment name in Azure
-    temperature=0.7,
-    max_tokens=4000,
-    extra_kwargs={
-        # Required Azure OpenAI parameters
-        "azure_endpoint": "https://your-resource-name.openai.azure.com/",  # Replace with your endpoint
-        "api_version": "2024-02-15-preview",  # Use the latest API version
-    }
-)
-
-# Initialize generator with Azure OpenAI
-generator = SyntheticDataGenerator(
-    model_config=model_config_gpt4o,
-    # You can pass the API key directly or set AZURE_OPENAI_API_KEY environment variable
-    # openai_api_key="your-azure-openai-api-key"
-)
-
-# Define output directory
-output_dir = os.path.join(
-    os.path.dirname(os.path.abspath(__file__)), 
-    "output", 
-    "test_azureopenai_models", 
-    "gpt-4o"
-)
+# Azure OpenAI connection settings shared by every deployment below
+azure_kwargs = {
+    # Required Azure OpenAI parameters
+    "azure_endpoint": "https://your-resource-name.openai.azure.com/",  # Replace with your endpoint
+    "api_version": "2024-02-15-preview",  # Use the latest API version
+}
+
+# Deployments to compare; each name should match a deployment in your Azure resource
+deployments = ["gpt-4o", "gpt-4o-mini"]
 
 sample_sizes = {'Patient': 20, 'Appointment': 30}
 
-# Generate and save to CSV
 
-results = generator.generate_for_schemas(
-    schemas=schemas,
-    prompts=prompts,
-    sample_sizes=sample_sizes,
-    output_dir=output_dir
-)
-print(f"✅ GPT-4o data saved to {output_dir}")
-print(f"Generated {len(results['Patient'])} patients and {len(results['Appointment'])} appointments")
+async def run_deployment(deployment: str, http_client: httpx.Client):
+    """Generate the healthcare data with one Azure OpenAI deployment."""
+    print(f"--------------Testing Azure OpenAI {deployment}----------------")
+
+    model_config = ModelConfig(
+        provider="azureopenai",
+        model_name=deployment,
+        temperature=0.7,
+        max_tokens=4000,
+        extra_kwargs=azure_kwargs
+    )
+
+    # Initialize generator with Azure OpenAI
+    generator = SyntheticDataGenerator(
+        model_config=model_config,
+        http_client=http_client,
+        # You can pass the API key directly or set AZURE_OPENAI_API_KEY environment variable
+        # openai_api_key="your-azure-openai-api-key"
+    )
+
+    output_dir = out_dir("test_azureopenai_models", deployment)
+
+    # Each schema is split into batches of 10 records that are requested concurrently
+    # (at most 4 requests in flight); the blocking generate_for_schemas accepts the same
+    # arguments if you are not running inside an event loop.
+    results = await generator.generate_for_schemas_async(
+        schemas=schemas,
+        prompts=prompts,
+        sample_sizes=sample_sizes,
+        output_dir=output_dir,
+        batch_size=10,
+        max_concurrency=4
+    )
+    return output_dir, results
+
+
+async def run_all():
+    """Run all deployments concurrently, so total time is close to the slowest run."""
+    # One HTTP client with a keep-alive connection pool, shared by every generator
+    # so connections and TLS sessions to the Azure endpoint are reused
+    http_client = httpx.Client(
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        timeout=httpx.Timeout(120.0, connect=10.0)
+    )
+    try:
+        outcomes = await asyncio.gather(
+            *(run_deployment(deployment, http_client) for deployment in deployments),
+            return_exceptions=True
+        )
+    finally:
+        http_client.close()
+
+    # A failing deployment doesn't stop the others; report each outcome
+    for deployment, outcome in zip(deployments, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"❌ {deployment} failed: {outcome}")
+            continue
+        output_dir, results = outcome
+        print(f"✅ {deployment} data saved to {output_dir}")
+        print(f"Generated {len(results['Patient'])} patients and {len(results['Appointment'])} appointments")
+
+
+asyncio.run(run_all())
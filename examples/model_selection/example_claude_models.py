@@ -1,10 +1,6 @@
 from syda.generate import SyntheticDataGenerator
 from syda.schemas import ModelConfig
-import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from _common import out_dir
 
 # Define schema for a single table
 schemas = {
@@ -41,12 +37,7 @@ model_config = ModelConfig(
 
 generator = SyntheticDataGenerator(model_config=model_config)
  # Define output directory
-output_dir = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), 
-        "output", 
-        "test_claude_models", 
-        "haiku-3-5"
-)
+output_dir = out_dir("test_claude_models", "haiku-3-5")
 # Generate and save to CSV
 results = generator.generate_for_schemas(
     schemas=schemas,
@@ -67,12 +58,7 @@ model_config = ModelConfig(
 
 generator = SyntheticDataGenerator(model_config=model_config)
  # Define output directory
-output_dir = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), 
-        "output", 
-        "test_claude_models", 
-        "sonnet-4"
-)
+output_dir = out_dir("test_claude_models", "sonnet-4")
 sample_sizes={'Patient': 100, 'Claim': 200}
 # Generate and save to CSV
 results = generator.generate_for_schemas(
@@ -93,12 +79,7 @@ model_config = ModelConfig(
 
 generator = SyntheticDataGenerator(model_config=model_config)
  # Define output directory
-output_dir = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), 
-        "output", 
-        "test_claude_models", 
-        "opus-4"
-)
+output_dir = out_dir("test_claude_models", "opus-4")
 sample_sizes={'Patient': 100, 'Claim': 200}
 # Generate and save to CSV
 results = generator.generate_for_schemas(
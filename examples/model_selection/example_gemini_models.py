@@ -1,10 +1,6 @@
 from syda.generate import SyntheticDataGenerator
 from syda.schemas import ModelConfig
-import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from _common import out_dir
 
 # Define schema for a single table
 schemas = {
@@ -41,12 +37,7 @@ model_config = ModelConfig(
 
 generator = SyntheticDataGenerator(model_config=model_config)
  # Define output directory
-output_dir = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), 
-        "output", 
-        "test_gemini_models", 
-        "flash-2-5"
-)
+output_dir = out_dir("test_gemini_models", "flash-2-5")
 # Generate and save to CSV
 results = generator.generate_for_schemas(
     schemas=schemas,
@@ -67,12 +58,7 @@ model_config = ModelConfig(
 
 generator = SyntheticDataGenerator(model_config=model_config)
  # Define output directory
-output_dir = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), 
-        "output", 
-        "test_gemini_models", 
-        "flash-2-0"
-)
+output_dir = out_dir("test_gemini_models", "flash-2-0")
 sample_sizes={'Patient': 50, 'Claim': 75}
 # Generate and save to CSV
 results = generator.generate_for_schemas(
@@ -94,12 +80,7 @@ model_config = ModelConfig(
 
 generator = SyntheticDataGenerator(model_config=model_config)
 # Define output directory
-output_dir = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), 
-        "output", 
-        "test_gemini_models", 
-        "pro-2-5"
-)
+output_dir = out_dir("test_gemini_models", "pro-2-5")
 sample_sizes={'Patient': 100, 'Claim': 150}  # Pro can handle larger datasets
 # Generate and save to CSV
 results = generator.generate_for_schemas(
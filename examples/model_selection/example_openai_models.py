@@ -1,10 +1,6 @@
 from syda.generate import SyntheticDataGenerator
 from syda.schemas import ModelConfig
-import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from _common import out_dir
 
 # Define schema for a single table
 schemas = {
@@ -42,12 +38,7 @@ model_config = ModelConfig(
 
 generator = SyntheticDataGenerator(model_config=model_config)
  # Define output directory
-output_dir = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), 
-        "output", 
-        "test_openai_models", 
-        "gpt-4o"
-)
+output_dir = out_dir("test_openai_models", "gpt-4o")
 # Generate and save to CSV
 results = generator.generate_for_schemas(
     schemas=schemas,
@@ -67,12 +58,7 @@ model_config = ModelConfig(
 
 generator = SyntheticDataGenerator(model_config=model_config)
  # Define output directory
-output_dir = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), 
-        "output", 
-        "test_openai_models", 
-        "o3"
-)
+output_dir = out_dir("test_openai_models", "o3")
 sample_sizes={'Patient': 100, 'Claim': 200}
 # Generate and save to CSV
 results = generator.generate_for_schemas(
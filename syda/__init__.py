@@ -52,7 +52,8 @@ For more details on validation, see:
     - syda.validators.CircularDependencyValidator
 """
 
-from .generate import SyntheticDataGenerator
+import importlib
+
 from .schemas import ModelConfig
 from .validators import (
     SchemaValidator,
@@ -66,6 +67,7 @@ from .validators import (
 __all__ = [
     'SyntheticDataGenerator',
     'ModelConfig',
+    'ResponseCache',
     'SchemaValidator',
     'ValidationResult',
     'ForeignKeyValidator',
@@ -74,6 +76,27 @@ __all__ = [
     'CircularDependencyValidator'
 ]
 
+# Attributes imported on first access, so that importing syda (e.g. only for
+# schema validation) doesn't load pandas and the LLM provider SDKs
+_LAZY_ATTRIBUTES = {
+    'SyntheticDataGenerator': '.generate',
+    'ResponseCache': '.cache',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 __version__ = '0.0.4'
 __author__ = 'Rama Krishna Kumar Lingamgunta'
 __email__ = 'ramkumar2606@gmail.com'
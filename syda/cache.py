@@ -0,0 +1,237 @@
+"""
+Response caching for LLM data generation.
+
+This module provides the ResponseCache class, which stores the records returned by the
+LLM for a given schema and prompt so that repeated runs (for example while iterating on
+an example script or in tests) can reuse earlier responses instead of issuing new
+requests.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from .serialization import canonical_json
+
+
+class ResponseCache:
+    """
+    Exact-match cache of LLM responses keyed by schema, prompt and model settings.
+
+    Keys are a SHA-256 digest of the canonical JSON of the schema, field metadata,
+    descriptions, prompt, model name and rounded temperature. The requested sample
+    size is not part of the key: a cached response with at least as many records
+    as requested is reused and trimmed to the requested row count.
+
+    Caching is only applied to low-temperature requests (temperature set and
+    <= max_temperature), since reusing high-temperature responses would remove
+    the variation those settings ask for.
+
+    Concurrent requests for the same key are coalesced by get_or_generate: the
+    first caller performs the request and the others wait for its result instead
+    of sending identical requests of their own.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_temperature: float = 0.3,
+        max_entries: int = 256
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Optional directory where responses are persisted as JSON files
+                       so they survive across processes
+            max_temperature: Highest temperature for which responses are cached
+            max_entries: Maximum number of responses kept in memory
+        """
+        self.cache_dir = cache_dir
+        self.max_temperature = max_temperature
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def is_enabled_for(self, temperature: Optional[float]) -> bool:
+        """
+        Check whether responses generated at the given temperature may be cached.
+
+        Args:
+            temperature: Temperature from the model configuration (None means the
+                         provider default, which is not deterministic)
+
+        Returns:
+            True if the response may be cached
+        """
+        return temperature is not None and temperature <= self.max_temperature
+
+    @staticmethod
+    def make_key(
+        table_schema: Dict[str, Any],
+        metadata: Dict[str, Any],
+        table_description: Optional[str],
+        prompt: Optional[str],
+        model_name: str,
+        temperature: Optional[float],
+        batch_index: int = 0
+    ) -> str:
+        """
+        Build the cache key for a generation request.
+
+        Args:
+            table_schema: Dictionary mapping field names to types
+            metadata: Dictionary with field metadata
+            table_description: Description of the table
+            prompt: Prompt for the AI model
+            model_name: Name of the model used for generation
+            temperature: Sampling temperature
+            batch_index: Index of the batch within a schema, so that batches of the
+                         same schema are cached separately
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = canonical_json(
+            {
+                "schema": table_schema,
+                "metadata": metadata,
+                "description": table_description,
+                "prompt": prompt,
+                "model": model_name,
+                "temperature": None if temperature is None else round(temperature, 2),
+                "batch": batch_index,
+            }
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str, sample_size: int) -> Optional[pd.DataFrame]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key
+            sample_size: Number of records requested
+
+        Returns:
+            A DataFrame with sample_size records, or None if there is no cached
+            response with enough records
+        """
+        with self._lock:
+            df = self._entries.get(key)
+            if df is not None:
+                self._entries.move_to_end(key)
+
+        if df is None and self.cache_dir and os.path.exists(self._path(key)):
+            try:
+                with open(self._path(key), "r", encoding="utf-8") as f:
+                    df = pd.DataFrame(json.load(f))
+            except (OSError, ValueError):
+                df = None
+            if df is not None:
+                self._store(key, df)
+
+        if df is None or len(df) < sample_size:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return df.iloc[:sample_size].copy()
+
+    def get_or_generate(
+        self,
+        key: str,
+        sample_size: int,
+        generate: Callable[[], pd.DataFrame]
+    ) -> Tuple[pd.DataFrame, bool]:
+        """
+        Return a cached response, or generate and cache one.
+
+        If another thread is already generating a response for the same key, this
+        waits for that response instead of calling generate again. Errors raised by
+        the generating thread are propagated to every waiting caller.
+
+        Args:
+            key: Cache key from make_key
+            sample_size: Number of records requested
+            generate: Function that performs the request and returns its records
+
+        Returns:
+            Tuple of (DataFrame with the records, True if the records were not
+            generated by this call)
+        """
+        df = self.get(key, sample_size)
+        if df is not None:
+            return df, True
+
+        with self._lock:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                future = Future()
+                self._inflight[key] = future
+
+        if inflight is not None:
+            shared = inflight.result()
+            if len(shared) >= sample_size:
+                with self._lock:
+                    self.coalesced += 1
+                return shared.iloc[:sample_size].copy(), True
+            # The request in flight asked for fewer records; make our own
+            df = generate()
+            self.put(key, df)
+            return df, False
+
+        try:
+            df = generate()
+            self.put(key, df)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(df)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        return df, False
+
+    def put(self, key: str, df: pd.DataFrame):
+        """
+        Store a response in the cache.
+
+        Args:
+            key: Cache key from make_key
+            df: DataFrame of records returned by the LLM
+        """
+        self._store(key, df.copy())
+        if self.cache_dir:
+            records = df.to_dict(orient="records")
+            with open(self._path(key), "w", encoding="utf-8") as f:
+                json.dump(records, f, default=str)
+
+    def _store(self, key: str, df: pd.DataFrame):
+        with self._lock:
+            self._entries[key] = df
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all in-memory entries."""
+        with self._lock:
+            self._entries.clear()
@@ -151,18 +151,17 @@ class ForeignKeyHandler:
                     all_valid = False
                     continue
                     
-                # Get all values in the foreign key column
-                fk_values = df[fk_column].dropna().unique()
+                # Check all foreign key values against the parent column in one
+                # vectorized hash-table lookup instead of a Python-level loop
+                fk_values = df[fk_column].dropna()
+                invalid_mask = ~fk_values.isin(parent_df[parent_column].dropna().unique())
                 
-                # Get all values in the parent column
-                parent_values = set(parent_df[parent_column].unique())
-                
-                # Check if all foreign key values exist in the parent column
-                invalid_values = [v for v in fk_values if v not in parent_values]
-                
-                if invalid_values:
+                if invalid_mask.any():
+                    invalid_values = pd.unique(fk_values[invalid_mask]).tolist()
+                    invalid_rows = fk_values.index[invalid_mask].tolist()
                     print(f"  [ERROR] Found {len(invalid_values)} invalid references in {schema_name}.{fk_column} to {parent_schema}.{parent_column}")
                     print(f"     Invalid values: {invalid_values[:5]}{'...' if len(invalid_values) > 5 else ''}")
+                    print(f"     Invalid rows: {invalid_rows[:5]}{'...' if len(invalid_rows) > 5 else ''}")
                     all_valid = False
                 else:
                     print(f"  [OK] All {schema_name}.{fk_column} values reference valid {parent_schema}.{parent_column}")
@@ -0,0 +1,229 @@
+"""
+Rate-limited dispatch of concurrent LLM requests.
+
+This module provides the ParallelRequestDispatcher used by SyntheticDataGenerator to
+throttle batched generation requests by requests-per-minute and tokens-per-minute, and
+to retry requests that fail with rate-limit (429) or server (5xx) errors using
+exponential backoff.
+"""
+
+import asyncio
+import functools
+import random
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+# Rough characters-per-token ratio used for request size estimates
+CHARS_PER_TOKEN = 4
+
+# Status codes that are worth retrying
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+# Exception class names raised by provider SDKs for transient failures
+RETRYABLE_ERROR_NAMES = {
+    "RateLimitError",
+    "APITimeoutError",
+    "APIConnectionError",
+    "InternalServerError",
+    "ServiceUnavailableError",
+    "OverloadedError",
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a piece of text.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Approximate token count (at least 1)
+    """
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def _get_status_code(error: BaseException) -> Optional[int]:
+    """Return the HTTP status code attached to an SDK exception, if any."""
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    Check whether an error (or any error it was raised from) is transient.
+
+    The generator wraps provider errors in ValueError, so the exception chain is
+    walked through __cause__ and __context__.
+
+    Args:
+        error: Exception raised by a generation request
+
+    Returns:
+        True if the request should be retried
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        status_code = _get_status_code(error)
+        if status_code is not None and (status_code in RETRYABLE_STATUS_CODES or status_code >= 500):
+            return True
+        if type(error).__name__ in RETRYABLE_ERROR_NAMES:
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class ParallelRequestDispatcher:
+    """
+    Throttle and retry concurrent LLM requests.
+
+    Capacity for requests and tokens refills continuously at the configured
+    per-minute rates. Each request waits until enough capacity is available
+    before it is sent, so bursts of concurrent batches stay under the provider's
+    rate limits instead of failing with 429 errors.
+    """
+
+    def __init__(
+        self,
+        max_requests_per_minute: Optional[float] = None,
+        max_tokens_per_minute: Optional[float] = None,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            max_requests_per_minute: Request rate limit, or None for no limit
+            max_tokens_per_minute: Token rate limit, or None for no limit
+            max_retries: Number of times a transient failure is retried
+            base_delay: Initial backoff delay in seconds
+            max_delay: Upper bound for the backoff delay in seconds
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self.available_request_capacity = float(max_requests_per_minute or 0)
+        self.available_token_capacity = float(max_tokens_per_minute or 0)
+        self._last_update = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_model_config(cls, model_config) -> "ParallelRequestDispatcher":
+        """
+        Create a dispatcher from the rate limit settings of a ModelConfig.
+
+        Args:
+            model_config: ModelConfig instance
+
+        Returns:
+            Configured ParallelRequestDispatcher
+        """
+        return cls(
+            max_requests_per_minute=getattr(model_config, "max_requests_per_minute", None),
+            max_tokens_per_minute=getattr(model_config, "max_tokens_per_minute", None),
+            max_retries=getattr(model_config, "max_retries", None) or 0
+        )
+
+    def _refill(self, now: float):
+        """Add the capacity accrued since the last update."""
+        elapsed = now - self._last_update
+        self._last_update = now
+        if self.max_requests_per_minute:
+            self.available_request_capacity = min(
+                float(self.max_requests_per_minute),
+                self.available_request_capacity + self.max_requests_per_minute * elapsed / 60.0
+            )
+        if self.max_tokens_per_minute:
+            self.available_token_capacity = min(
+                float(self.max_tokens_per_minute),
+                self.available_token_capacity + self.max_tokens_per_minute * elapsed / 60.0
+            )
+
+    def _try_consume(self, tokens: int) -> float:
+        """
+        Consume capacity for one request if available.
+
+        Returns:
+            0.0 if capacity was consumed, otherwise the number of seconds to wait
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+
+            # A single request larger than the whole budget can never fit; cap it
+            if self.max_tokens_per_minute:
+                tokens = min(tokens, self.max_tokens_per_minute)
+
+            wait = 0.0
+            if self.max_requests_per_minute and self.available_request_capacity < 1:
+                wait = max(wait, (1 - self.available_request_capacity) * 60.0 / self.max_requests_per_minute)
+            if self.max_tokens_per_minute and self.available_token_capacity < tokens:
+                wait = max(wait, (tokens - self.available_token_capacity) * 60.0 / self.max_tokens_per_minute)
+            if wait > 0:
+                return wait
+
+            if self.max_requests_per_minute:
+                self.available_request_capacity -= 1
+            if self.max_tokens_per_minute:
+                self.available_token_capacity -= tokens
+            return 0.0
+
+    async def acquire(self, tokens: int = 0):
+        """
+        Wait until there is capacity for a request of the given size.
+
+        Args:
+            tokens: Estimated number of tokens used by the request
+        """
+        while True:
+            wait = self._try_consume(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter for the given retry attempt."""
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (0.5 + random.random() / 2)
+
+    async def submit(self, func: Callable[..., Any], *args, estimated_tokens: int = 0, **kwargs) -> Any:
+        """
+        Run a blocking request function once capacity is available.
+
+        The function is executed in the event loop's default executor. Transient
+        failures are retried with exponential backoff up to max_retries times.
+
+        Args:
+            func: Blocking function that performs the request
+            *args: Positional arguments for func
+            estimated_tokens: Estimated token usage, used for TPM throttling
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The return value of func
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs)
+        attempt = 0
+        while True:
+            await self.acquire(estimated_tokens)
+            try:
+                return await loop.run_in_executor(None, call)
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable_error(e):
+                    raise
+                delay = self._backoff_delay(attempt)
+                attempt += 1
+                print(f"[WARNING] Request failed ({str(e)[:100]}), retrying in {delay:.1f}s "
+                      f"(attempt {attempt}/{self.max_retries})")
+                await asyncio.sleep(delay)
@@ -18,10 +18,13 @@ The library is designed to be extensible, with the ability to add new LLM provid
 and custom generators for specific data types.
 """
 
+import asyncio
+import concurrent.futures
 import pandas as pd
 import json
 import os
 import random
+import threading
 import pkgutil
 import importlib
 import inspect
@@ -39,6 +42,9 @@ from .utils import (
     parse_dataframe_output
 )
 from .dependency_handler import DependencyHandler, ForeignKeyHandler
+from .dispatcher import ParallelRequestDispatcher, estimate_tokens
+from .cache import ResponseCache
+from .serialization import canonical_json
 from .custom_generators import GeneratorManager
 from .schema_loader import SchemaLoader
 
@@ -49,6 +55,21 @@ except ImportError:
     DeclarativeMeta = None
 
 
+def _run_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run when no event loop is running in this thread. Inside a running
+    loop (e.g. Jupyter), the coroutine is run on a fresh loop in a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
 class SyntheticDataGenerator:
     """Generator for synthetic data using LLMs."""
     
@@ -58,7 +79,9 @@ class SyntheticDataGenerator:
         openai_api_key: Optional[str] = None,
         anthropic_api_key: Optional[str] = None,
         gemini_api_key: Optional[str] = None,
-        grok_api_key: Optional[str] = None
+        grok_api_key: Optional[str] = None,
+        response_cache: Optional[ResponseCache] = None,
+        http_client: Optional[Any] = None
     ):
         """
         Initialize the synthetic data generator with the specified model configuration.
@@ -72,6 +95,11 @@ class SyntheticDataGenerator:
                               ANTHROPIC_API_KEY environment variable.
             gemini_api_key: Optional API key for Gemini. If not provided, will use GEMINI_API_KEY
             grok_api_key: Optional API key for Grok. If not provided, will use GROK_API_KEY
+            response_cache: Optional ResponseCache used to reuse LLM responses for
+                            identical schema/prompt requests at low temperature
+            http_client: Optional httpx.Client to share between several generators so
+                         that HTTP connections are reused (OpenAI, Azure OpenAI,
+                         Anthropic and Grok providers)
         """
         # Initialize the LLM client using our new module
         self.llm_client = create_llm_client(
@@ -79,7 +107,8 @@ class SyntheticDataGenerator:
             openai_api_key=openai_api_key,
             anthropic_api_key=anthropic_api_key,
             gemini_api_key=gemini_api_key,
-            grok_api_key=grok_api_key
+            grok_api_key=grok_api_key,
+            http_client=http_client
         )
         
         # Store the model configuration for easy access
@@ -88,6 +117,18 @@ class SyntheticDataGenerator:
         # Access the instructor client directly
         self.client = self.llm_client.client
         
+        # Generation orders already computed, keyed by dependency structure
+        self._generation_order_cache = {}
+
+        # Schema validator, kept so repeated runs reuse its cached results
+        self._schema_validator = None
+
+        # Optional cache of LLM responses
+        self.response_cache = response_cache
+
+        # Throttles and retries concurrent LLM requests according to the model config
+        self.dispatcher = ParallelRequestDispatcher.from_model_config(self.model_config)
+
         # Initialize the generator manager
         self.generator_manager = GeneratorManager()
         
@@ -239,11 +280,53 @@ class SyntheticDataGenerator:
         default_sample_size: int = 10,
         default_prompt: str = "Generate synthetic data",
         custom_generators: Optional[Dict[str, Dict[str, Callable]]] = None,
-        output_format: str = 'csv'
+        output_format: str = 'csv',
+        max_concurrency: int = 4,
+        batch_size: Optional[int] = None
     ) -> Dict[str, pd.DataFrame]:
         """
-        Generate synthetic data for multiple related schemas with automatic 
+        Generate synthetic data for multiple related schemas with automatic
         dependency resolution based on foreign key relationships.
+
+        This is a blocking wrapper around generate_for_schemas_async; see that
+        method for the full description of the arguments.
+
+        Returns:
+            Dictionary mapping schema names to DataFrames of generated data
+        """
+        return _run_sync(self.generate_for_schemas_async(
+            schemas=schemas,
+            prompts=prompts,
+            sample_sizes=sample_sizes,
+            output_dir=output_dir,
+            default_sample_size=default_sample_size,
+            default_prompt=default_prompt,
+            custom_generators=custom_generators,
+            output_format=output_format,
+            max_concurrency=max_concurrency,
+            batch_size=batch_size
+        ))
+
+    async def generate_for_schemas_async(
+        self,
+        schemas: Dict[str, Union[Dict[str, str], str]],
+        prompts: Optional[Dict[str, str]] = None,
+        sample_sizes: Optional[Dict[str, int]] = None,
+        output_dir: Optional[str] = None,
+        default_sample_size: int = 10,
+        default_prompt: str = "Generate synthetic data",
+        custom_generators: Optional[Dict[str, Dict[str, Callable]]] = None,
+        output_format: str = 'csv',
+        max_concurrency: int = 4,
+        batch_size: Optional[int] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Generate synthetic data for multiple related schemas with automatic
+        dependency resolution based on foreign key relationships.
+
+        Schemas are still generated in dependency order, but a schema whose
+        sample size exceeds batch_size is split into several smaller LLM requests
+        that are dispatched concurrently (at most max_concurrency in flight).
         
         This function supports different schema input formats:
         - Dictionary schemas directly in the code
@@ -284,7 +367,9 @@ class SyntheticDataGenerator:
                     - File paths to JSON or YAML schema files
             prompts: Optional dictionary mapping schema names to custom prompts
             sample_sizes: Optional dictionary mapping schema names to sample sizes
-            output_dir: Optional directory to save files (one per schema)
+            output_dir: Optional directory to save files (one per schema). Files are
+                        written as each schema completes; if generation fails, the
+                        files written by this call are removed again
             default_sample_size: Default number of records if not specified in sample_sizes
             default_prompt: Default prompt if not specified in prompts
             custom_generators: Optional dictionary specifying custom generators for schemas and columns.
@@ -307,10 +392,13 @@ class SyntheticDataGenerator:
                                ```
                               Format: {"SchemaName": {"column_name": generator_function}}
             output_format: Format to use when saving files ('csv' or 'json')
-            
+            max_concurrency: Maximum number of LLM requests in flight at the same time
+            batch_size: Optional number of records per LLM request. If None, each schema
+                        is generated with a single request.
+
         Returns:
             Dictionary mapping schema names to DataFrames of generated data
-        
+
         Example with dictionary schemas:
             schemas = {
                 'Customer': {
@@ -370,11 +458,12 @@ class SyntheticDataGenerator:
         try:
             from syda.validators import SchemaValidator, ValidationResult
             
-            # Initialize validator
-            validator = SchemaValidator()
+            # Initialize validator once per generator
+            if self._schema_validator is None:
+                self._schema_validator = SchemaValidator()
             
             # Run validation on raw schemas
-            validation_result = validator.validate_schemas(schemas, strict=False)
+            validation_result = self._schema_validator.validate_schemas(schemas, strict=False)
             
             # Print validation report
             print(validation_result.summary())
@@ -428,12 +517,21 @@ class SyntheticDataGenerator:
         generation_order = list(schemas.keys())
         
         try:
-            # Build dependency graph and determine generation order
-            dependency_graph = DependencyHandler.build_dependency_graph(
-                nodes=list(schemas.keys()),
-                dependencies=all_dependencies
+            # Build dependency graph and determine generation order, reusing the
+            # order computed for an identical dependency structure
+            order_key = (
+                tuple(schemas.keys()),
+                tuple(sorted((name, tuple(deps)) for name, deps in all_dependencies.items()))
             )
-            generation_order = DependencyHandler.determine_generation_order(dependency_graph)
+            if order_key in self._generation_order_cache:
+                generation_order = list(self._generation_order_cache[order_key])
+            else:
+                dependency_graph = DependencyHandler.build_dependency_graph(
+                    nodes=list(schemas.keys()),
+                    dependencies=all_dependencies
+                )
+                generation_order = DependencyHandler.determine_generation_order(dependency_graph)
+                self._generation_order_cache[order_key] = tuple(generation_order)
             
             print("\n[INFO] Generation order determined:")
             for i, schema in enumerate(generation_order):
@@ -449,32 +547,65 @@ class SyntheticDataGenerator:
         
         # Dictionary to hold generated data
         results = {}
-        
+
+        # Files written so far, removed again if generation fails
+        written_paths = []
+        output_lock = threading.Lock()
+        generation_failed = False
+
+        def remove_files(paths):
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+        def save_schema_output(schema_name, df):
+            # Structured schemas are written as soon as they are generated, while
+            # other schemas are still waiting on the LLM; template schemas are
+            # rendered to documents once everything is done
+            if output_dir and schema_name not in template_schemas:
+                paths = save_dataframes({schema_name: df}, output_dir, format=output_format)
+                with output_lock:
+                    if generation_failed:
+                        # A write still running when generation failed
+                        remove_files(paths)
+                    else:
+                        written_paths.extend(paths)
+
         try:
             # Generate structured data using the extracted method
-            results = self._generate_structured_data(
-                processed_schemas=processed_schemas,
-                schema_metadata=schema_metadata,
-                schema_descriptions=schema_descriptions,
-                generation_order=generation_order,
-                extracted_foreign_keys=extracted_foreign_keys,
-                prompts=prompts,
-                sample_sizes=sample_sizes,
-                custom_generators=custom_generators,
-                default_prompt=default_prompt,
-                default_sample_size=default_sample_size
-            )
+            try:
+                results = await self._generate_structured_data(
+                    processed_schemas=processed_schemas,
+                    schema_metadata=schema_metadata,
+                    schema_descriptions=schema_descriptions,
+                    generation_order=generation_order,
+                    extracted_foreign_keys=extracted_foreign_keys,
+                    prompts=prompts,
+                    sample_sizes=sample_sizes,
+                    custom_generators=custom_generators,
+                    default_prompt=default_prompt,
+                    default_sample_size=default_sample_size,
+                    max_concurrency=max_concurrency,
+                    batch_size=batch_size,
+                    dependencies=all_dependencies,
+                    on_schema_complete=save_schema_output
+                )
+            except BaseException:
+                # Don't leave a partial set of output files behind
+                with output_lock:
+                    generation_failed = True
+                    remove_files(written_paths)
+                raise
           
-            # Separate template schemas from structured schemas
+            # Collect template schemas; structured schemas were already saved as they completed
             template_schemas_dfs = {}
-            structured_results = {}
             #print("results: ", results)
             for schema_name, df in results.items():
                 # Check if this is a template schema by looking for __template_source__ field
                 if df is not None and schema_name in template_schemas:
                     template_schemas_dfs[schema_name] = (df, template_schemas[schema_name])
-                else:
-                    structured_results[schema_name] = df
             
             # Process template schemas if any
             template_results = {}
@@ -487,10 +618,6 @@ class SyntheticDataGenerator:
                 # Use the new method to process all template dataframes at once
                 template_results = processor.process_template_dataframes(template_schemas_dfs, output_dir)
             
-            # Save files if output_dir is specified
-            if output_dir:
-                save_dataframes(structured_results, output_dir, format=output_format)
-            
             # Verify referential integrity using ForeignKeyHandler
             self.fk_handler.verify_referential_integrity(results, extracted_foreign_keys)
                     
@@ -500,21 +627,32 @@ class SyntheticDataGenerator:
         return results
 
 
-    def _generate_structured_data(
-        self, 
+    async def _generate_structured_data(
+        self,
         processed_schemas,
         schema_metadata,
         schema_descriptions,
-        generation_order, 
+        generation_order,
         extracted_foreign_keys,
         prompts, sample_sizes,
         custom_generators,
-        default_prompt, 
-        default_sample_size
+        default_prompt,
+        default_sample_size,
+        max_concurrency=4,
+        batch_size=None,
+        dependencies=None,
+        on_schema_complete=None
     ):
         """
         Generate structured data for each schema in the specified generation order.
-        
+
+        Schemas whose dependencies have been generated are scheduled right away, so
+        independent schemas share the max_concurrency request slots instead of waiting
+        for each other. A schema waits for every earlier schema it depends on, shares
+        foreign key column names with, or may read through custom generators that
+        receive parent dataframes, which keeps the result identical to generating the
+        schemas one after another.
+
         Args:
             processed_schemas: Dictionary of processed schemas
             schema_metadata: Dictionary of metadata for each schema
@@ -526,60 +664,80 @@ class SyntheticDataGenerator:
             custom_generators: Dictionary of custom generators for each schema
             default_prompt: Default prompt to use if no schema-specific prompt is provided
             default_sample_size: Default sample size to use if no schema-specific sample size is provided
-            
+            max_concurrency: Maximum number of LLM requests in flight at the same time
+            batch_size: Optional number of records per LLM request
+            dependencies: Optional dictionary mapping schema names to the schemas they depend on
+            on_schema_complete: Optional blocking callable (schema_name, df) run in the
+                                default executor as soon as a schema has been generated,
+                                e.g. to write its output file
+
+
         Returns:
             Dictionary mapping schema names to generated DataFrames
         """
         results = {}
-        
-        # Generate data for each schema in the correct order
-        for schema_name in generation_order:
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        prerequisites = self._schema_prerequisites(
+            generation_order, processed_schemas, extracted_foreign_keys,
+            dependencies or {}, custom_generators
+        )
+        completed = {schema_name: asyncio.Event() for schema_name in generation_order}
+
+        async def generate_schema(schema_name):
+            # Wait until every schema this one relies on has been generated. If a
+            # prerequisite fails its event is never set and the waiting task is
+            # cancelled below.
+            for prerequisite in prerequisites[schema_name]:
+                await completed[prerequisite].wait()
+
             schema = processed_schemas[schema_name]
             metadata = schema_metadata[schema_name]
             description = schema_descriptions[schema_name]
-            
+
             print(f"\nGenerating data for {schema_name} with {len(schema)} columns")
             print(f"Description: {description}")
-            
+
             # Get the prompt and sample size for this schema
             prompt = prompts.get(schema_name, default_prompt)
             sample_size = sample_sizes.get(schema_name, default_sample_size)
-            
+
             # Apply foreign key constraints using the ForeignKeyHandler
             self.fk_handler.apply_foreign_keys(schema_name, extracted_foreign_keys, results)
-            
+
             # We'll let generate_data handle the prompt building with metadata
             # by passing the schema directly, along with the base prompt
             # This eliminates duplicated prompt-building logic
             # Use AI-based generation for meaningful data
             print(f"Creating data for {schema_name} with schema: {schema}")
-            
+
             # Use the schema information we already extracted earlier
             llm_schema = processed_schemas[schema_name]
             metadata = schema_metadata[schema_name]
             model_description = schema_descriptions[schema_name]
-            
+
             # Try to use the AI generation first
             try:
                 # Use the _generate_data method to generate data for this schema
                 # Pass the already extracted schema information to avoid redundant extraction
-                df = self._generate_data(
-                    table_schema=llm_schema, 
-                    metadata=metadata, 
+                df = await self._generate_data_batched(
+                    semaphore=semaphore,
+                    batch_size=batch_size,
+                    table_schema=llm_schema,
+                    metadata=metadata,
                     table_description=model_description,
-                    prompt=prompt, 
+                    prompt=prompt,
                     sample_size=sample_size,
                 )
-                
+
                 # Check if we have the requested sample size
                 if len(df) < sample_size:
                     print(f"Warning: LLM generated only {len(df)} records instead of {sample_size} for {schema_name}")
                     # We don't fill with placeholder data - we'll use what the LLM gave us
-                
+
                 # Truncate if we got more data than needed
                 if len(df) > sample_size:
                     df = df.iloc[:sample_size]
-                    
+
             except Exception as e:
                 print(f"Error using AI generation for {schema_name}: {str(e)}")
                 # We don't use placeholder data - require a real LLM
@@ -591,13 +749,132 @@ class SyntheticDataGenerator:
                 df, schema_name, schema_custom_generators, parent_dfs=results)
             # Store the result
             results[schema_name] = df
-            
-        return results
-        
+            completed[schema_name].set()
+
+            if on_schema_complete is not None:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, on_schema_complete, schema_name, df)
+
+        tasks = [asyncio.ensure_future(generate_schema(schema_name)) for schema_name in generation_order]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Don't leave schemas waiting on a parent that will never complete
+            for task in tasks:
+                task.cancel()
+            raise
+
+        # Return results in generation order regardless of completion order
+        return {schema_name: results[schema_name] for schema_name in generation_order if schema_name in results}
+
+    @staticmethod
+    def _schema_prerequisites(generation_order, processed_schemas, extracted_foreign_keys,
+                              dependencies, custom_generators):
+        """
+        Determine which earlier schemas each schema has to wait for.
+
+        Foreign key generators are registered per column name, so two schemas can only
+        be generated at the same time when neither one registers a generator for a
+        column the other one contains.
+
+        Args:
+            generation_order: List of schema names in generation order
+            processed_schemas: Dictionary of processed schemas
+            extracted_foreign_keys: Dictionary of foreign key relationships
+            dependencies: Dictionary mapping schema names to the schemas they depend on
+            custom_generators: Dictionary of custom generators for each schema
+
+        Returns:
+            Dictionary mapping schema names to the list of schemas to wait for
+        """
+        columns = {name: set(processed_schemas.get(name, {})) for name in generation_order}
+        fk_columns = {name: set(extracted_foreign_keys.get(name, {})) for name in generation_order}
+
+        prerequisites = {}
+        for position, schema_name in enumerate(generation_order):
+            earlier = generation_order[:position]
+            schema_generators = custom_generators.get(schema_name, {}) or {}
+            reads_parent_dfs = any(
+                getattr(getattr(generator, '__code__', None), 'co_argcount', 0) >= 3
+                for generator in schema_generators.values()
+            )
+            if reads_parent_dfs:
+                prerequisites[schema_name] = list(earlier)
+                continue
+
+            schema_dependencies = set(dependencies.get(schema_name, []))
+            prerequisites[schema_name] = [
+                other for other in earlier
+                if other in schema_dependencies
+                or fk_columns[other] & columns[schema_name]
+                or fk_columns[schema_name] & columns[other]
+            ]
+        return prerequisites
+
+    async def _generate_data_batched(self, semaphore, batch_size, sample_size, **kwargs):
+        """
+        Generate data for one schema, splitting the request into concurrent batches.
+
+        The blocking _generate_data call is run through the generator's dispatcher,
+        which executes it in the default executor (so the synchronous provider client
+        is shared across concurrent requests), throttles it by the configured request
+        and token rate limits, and retries transient failures.
+
+        Args:
+            semaphore: asyncio.Semaphore bounding the number of in-flight requests
+            batch_size: Maximum records per request, or None for a single request
+            sample_size: Total number of records to generate
+            **kwargs: Remaining keyword arguments forwarded to _generate_data
+
+        Returns:
+            DataFrame with the concatenated batches
+        """
+        if not batch_size or sample_size <= batch_size:
+            batch_sizes = [sample_size]
+        else:
+            batch_sizes = [batch_size] * (sample_size // batch_size)
+            if sample_size % batch_size:
+                batch_sizes.append(sample_size % batch_size)
+
+        async def run_batch(index, size):
+            async with semaphore:
+                return await self.dispatcher.submit(
+                    self._generate_data,
+                    sample_size=size,
+                    batch_index=index,
+                    estimated_tokens=self._estimate_request_tokens(kwargs.get('table_schema', {}), size),
+                    **kwargs
+                )
+
+        frames = await asyncio.gather(*(run_batch(i, size) for i, size in enumerate(batch_sizes)))
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
+
+    def _estimate_request_tokens(self, table_schema, sample_size):
+        """
+        Estimate the total tokens (prompt and completion) used by one generation request.
+
+        Args:
+            table_schema: Dictionary mapping field names to types
+            sample_size: Number of records requested
+
+        Returns:
+            Approximate token count used for rate limiting
+        """
+        schema_text = canonical_json(table_schema)
+        prompt_tokens = estimate_tokens(schema_text)
+        # Each generated record repeats the field names alongside their values
+        completion_tokens = estimate_tokens(schema_text) * sample_size
+        max_tokens = self.model_config.max_tokens or self.model_config.max_completion_tokens
+        if max_tokens:
+            completion_tokens = min(completion_tokens, max_tokens)
+        return prompt_tokens + completion_tokens
+
     def _build_prompt(self, table_schema, metadata, table_description, primary_key_fields, prompt, sample_size):
         """
         Build a structured prompt for the LLM to generate data.
-        
+
         Args:
             table_schema: Dictionary mapping field names to types
             metadata: Dictionary with field metadata including descriptions and constraints
@@ -605,10 +882,40 @@ class SyntheticDataGenerator:
             primary_key_fields: List of primary key field names
             prompt: Base prompt text
             sample_size: Number of records to generate
-            
+
         Returns:
             Formatted prompt for the LLM
         """
+        static_prompt, dynamic_prompt = self._build_prompt_parts(
+            table_schema, metadata, table_description, primary_key_fields, prompt, sample_size
+        )
+        full_prompt = f"{static_prompt}\n{dynamic_prompt}"
+
+        print(f"Full Prompt: {full_prompt}")
+
+        return full_prompt
+
+    def _build_prompt_parts(self, table_schema, metadata, table_description, primary_key_fields, prompt, sample_size):
+        """
+        Build the prompt as a static prefix and a per-request suffix.
+
+        The prefix (field definitions and descriptions) is identical for every request
+        made for a schema, so providers can serve it from their prompt cache: OpenAI and
+        Azure OpenAI cache matching prefixes automatically and Anthropic caches blocks
+        marked with cache_control. Everything that varies between requests, such as the
+        number of records, is kept in the suffix.
+
+        Args:
+            table_schema: Dictionary mapping field names to types
+            metadata: Dictionary with field metadata including descriptions and constraints
+            table_description: Optional description of the table
+            primary_key_fields: List of primary key field names
+            prompt: Base prompt text
+            sample_size: Number of records to generate
+
+        Returns:
+            Tuple of (static_prompt, dynamic_prompt)
+        """
         # Create a list to hold field descriptions
         field_descriptions = []
         
@@ -667,29 +974,57 @@ class SyntheticDataGenerator:
             field_descriptions.append(field_desc)
         
         # Start with the basic instruction
-        full_prompt = f"Generate {sample_size} records JSON objects with these fields:\n"
-        full_prompt += "\n".join(field_descriptions)
-        
+        static_prompt = "Generate records as JSON objects with these fields:\n"
+        static_prompt += "\n".join(field_descriptions)
+
         # Add the description
         if prompt and prompt != "Generate synthetic data":
-            full_prompt += f"\nDescription: {prompt}"
-        
+            static_prompt += f"\nDescription: {prompt}"
+
         # Include table description if available
         if table_description:
-            full_prompt += f"\nTable Description: {table_description}"
-            
-        print(f"Full Prompt: {full_prompt}")
-        
-        return full_prompt
+            static_prompt += f"\nTable Description: {table_description}"
+
+        dynamic_prompt = f"Generate {sample_size} records."
+
+        return static_prompt, dynamic_prompt
+
+    def _build_messages(self, full_prompt, prompt_parts=None):
+        """
+        Build the chat messages for a generation request.
+
+        For Anthropic models the static part of the prompt is sent as a separate
+        content block marked with cache_control, so repeated requests for the same
+        schema (e.g. concurrent batches) read it from the prompt cache.
+
+        Args:
+            full_prompt: Complete prompt text
+            prompt_parts: Optional tuple of (static_prompt, dynamic_prompt)
+
+        Returns:
+            List of chat messages
+        """
+        if prompt_parts and self.model_config.provider == "anthropic":
+            static_prompt, dynamic_prompt = prompt_parts
+            return [{
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": static_prompt, "cache_control": {"type": "ephemeral"}},
+                    {"type": "text", "text": dynamic_prompt},
+                ],
+            }]
+        return [{"role": "user", "content": full_prompt}]
             
-    def _generate_data_with_llm(self, llm_schema, full_prompt, sample_size):
+    def _generate_data_with_llm(self, llm_schema, full_prompt, sample_size, prompt_parts=None):
         """
         Generate data using the LLM based on the schema and prompt.
-        
+
         Args:
             llm_schema: Dictionary mapping field names to types
             full_prompt: Complete prompt to send to the LLM
             sample_size: Number of records to generate
+            prompt_parts: Optional tuple of (static_prompt, dynamic_prompt) used to mark
+                          the cacheable prompt prefix for providers that support it
             
         Returns:
             DataFrame of generated data
@@ -735,6 +1070,8 @@ class SyntheticDataGenerator:
         if 'model' not in model_kwargs:
             model_kwargs['model'] = self.model_config.model_name
         
+        messages = self._build_messages(full_prompt, prompt_parts)
+
         try:
             print(f"Generating data using {self.model_config.provider}/{self.model_config.model_name}...")
             print(f"Full Prompt: {full_prompt}")
@@ -757,7 +1094,7 @@ class SyntheticDataGenerator:
                 # Use create_iterable for streaming multiple objects
                 ai_obj_stream = self.client.chat.completions.create_iterable(
                     response_model=DynamicInstructorModel,
-                    messages=[{"role": "user", "content": full_prompt}],
+                    messages=messages,
                     **model_kwargs,
                 )
                 
@@ -767,7 +1104,7 @@ class SyntheticDataGenerator:
                 # Regular non-streaming call for other providers or smaller sample sizes
                 ai_objs = self.client.chat.completions.create(
                     response_model=List[DynamicInstructorModel],
-                    messages=[{"role": "user", "content": full_prompt}],
+                    messages=messages,
                     **model_kwargs,
                 )
             
@@ -870,7 +1207,8 @@ class SyntheticDataGenerator:
                      metadata: Dict[str, Dict],
                      table_description: Optional[str] = None,
                      prompt: str = "Generate synthetic data",
-                     sample_size: int = 10) -> pd.DataFrame:
+                     sample_size: int = 10,
+                     batch_index: int = 0) -> pd.DataFrame:
         """
         Generate synthetic data based on schema using AI.
         
@@ -880,7 +1218,9 @@ class SyntheticDataGenerator:
             table_description: Optional description of the table to guide generation
             prompt: Prompt for the AI model
             sample_size: Number of samples to generate
-            
+            batch_index: Index of this request within a batched schema, used to keep
+                         cached responses of different batches apart
+
         Returns:
             DataFrame with generated data
             
@@ -894,12 +1234,27 @@ class SyntheticDataGenerator:
             if 'constraints' in col_meta and 'primary_key' in col_meta['constraints']:
                 primary_key_fields.append(col)
         
-        # Build prompt for LLM
-        full_prompt = self._build_prompt(table_schema, metadata, table_description, 
-                                      primary_key_fields, prompt, sample_size)
+        # Build prompt for LLM, keeping the per-request part at the end so the
+        # schema prefix can be served from the provider's prompt cache
+        prompt_parts = self._build_prompt_parts(table_schema, metadata, table_description,
+                                                primary_key_fields, prompt, sample_size)
+        full_prompt = "\n".join(prompt_parts)
+        print(f"Full Prompt: {full_prompt}")
         
-        # Generate data using LLM
-        df = self._generate_data_with_llm(table_schema, full_prompt, sample_size)
+        # Generate data using LLM, reusing a cached (or identical in-flight) request if available
+        if self.response_cache is not None and self.response_cache.is_enabled_for(self.model_config.temperature):
+            cache_key = self.response_cache.make_key(
+                table_schema, metadata, table_description, prompt,
+                self.model_config.model_name, self.model_config.temperature, batch_index
+            )
+            df, reused = self.response_cache.get_or_generate(
+                cache_key, sample_size,
+                lambda: self._generate_data_with_llm(table_schema, full_prompt, sample_size, prompt_parts)
+            )
+            if reused:
+                print(f"[OK] Using cached response with {len(df)} records")
+        else:
+            df = self._generate_data_with_llm(table_schema, full_prompt, sample_size, prompt_parts)
         
         # Apply type-based generators
         df = self._apply_type_generators(df, table_schema)
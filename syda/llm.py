@@ -23,6 +23,7 @@ class LLMClient:
         anthropic_api_key: Optional[str] = None,
         gemini_api_key: Optional[str] = None,
         grok_api_key: Optional[str] = None,
+        http_client: Optional[Any] = None,
         **kwargs
     ):
         """
@@ -34,6 +35,9 @@ class LLMClient:
             anthropic_api_key: Optional API key for Anthropic
             gemini_api_key: Optional API key for Gemini
             grok_api_key: Optional API key for Grok
+            http_client: Optional httpx.Client shared between LLM clients so that
+                         connections (and TLS sessions) are reused. Used by the
+                         OpenAI, Azure OpenAI, Anthropic and Grok providers.
             **kwargs: Additional keyword arguments to pass to the client
         """
         # Set up API keys from arguments or environment variables
@@ -52,10 +56,24 @@ class LLMClient:
             
         # Store additional kwargs
         self.kwargs = kwargs
+        self.http_client = http_client
         
         # Initialize the client
         self.client = self._initialize_client()
     
+    def _client_kwargs(self) -> Dict[str, Any]:
+        """
+        Build the constructor kwargs for the raw provider client.
+        
+        Returns:
+            extra_kwargs from the model configuration, plus the shared http_client
+            if one was provided and extra_kwargs doesn't set its own
+        """
+        client_kwargs = dict(self.model_config.extra_kwargs or {})
+        if self.http_client is not None and "http_client" not in client_kwargs:
+            client_kwargs["http_client"] = self.http_client
+        return client_kwargs
+    
     def _initialize_client(self) -> Any:
         """
         Initialize and return the appropriate LLM client based on the model configuration.
@@ -74,11 +92,7 @@ class LLMClient:
                 os.environ["OPENAI_API_KEY"] = self.openai_api_key
                 
             # OpenAI configuration with extra_kwargs support
-            openai_kwargs = {}
-            
-            # Add extra_kwargs from model configuration if provided
-            if self.model_config.extra_kwargs:
-                openai_kwargs.update(self.model_config.extra_kwargs)
+            openai_kwargs = self._client_kwargs()
                 
             # Initialize raw OpenAI client
             raw_client = openai.OpenAI(**openai_kwargs)
@@ -89,11 +103,7 @@ class LLMClient:
         elif provider == "azureopenai":
                 
             # Azure OpenAI configuration - users must provide all required params via extra_kwargs
-            azure_kwargs = {}
-            
-            # Add extra_kwargs from model configuration (required by user)
-            if self.model_config.extra_kwargs:
-                azure_kwargs.update(self.model_config.extra_kwargs)
+            azure_kwargs = self._client_kwargs()
             
             # Add API key from environment if not provided in extra_kwargs
             if "api_key" not in azure_kwargs:
@@ -116,11 +126,7 @@ class LLMClient:
                 from anthropic import Anthropic
                 
                 # Anthropic configuration with extra_kwargs support
-                anthropic_kwargs = {}
-                
-                # Add extra_kwargs from model configuration if provided
-                if self.model_config.extra_kwargs:
-                    anthropic_kwargs.update(self.model_config.extra_kwargs)
+                anthropic_kwargs = self._client_kwargs()
                     
                 # Create raw client
                 raw_client = Anthropic(**anthropic_kwargs)
@@ -163,11 +169,7 @@ class LLMClient:
                 os.environ["GROK_API_KEY"] = self.grok_api_key
 
             # Grok configuration with extra_kwargs support
-            grok_kwargs = {}
-            
-            # Add extra_kwargs from model configuration if provided
-            if self.model_config.extra_kwargs:
-                grok_kwargs.update(self.model_config.extra_kwargs)
+            grok_kwargs = self._client_kwargs()
             # For Grok, we'll use the OpenAI-compatible interface
             # since xAI provides an OpenAI-compatible API
             try:
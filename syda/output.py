@@ -4,9 +4,14 @@ Output utilities for saving generated data to various formats.
 
 import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Union, List
 
 
+# Default upper bound on concurrent file writes in save_dataframes
+MAX_WRITE_WORKERS = 8
+
+
 def save_dataframe(
     df: pd.DataFrame,
     file_path: str,
@@ -68,30 +73,40 @@ def save_dataframes(
     data_dict: Dict[str, pd.DataFrame],
     output_dir: str,
     format: str = 'csv',
-    filenames: Optional[Dict[str, str]] = None
+    filenames: Optional[Dict[str, str]] = None,
+    max_workers: Optional[int] = None
 ) -> List[str]:
     """
     Save multiple DataFrames to files in a directory.
     
+    Files are written concurrently from a thread pool, since the writes spend most
+    of their time in I/O.
+    
     Args:
         data_dict: Dictionary mapping names to DataFrames
         output_dir: Directory where files should be saved
         format: File format to use ('csv' or 'json')
         filenames: Optional dictionary mapping schema names to custom filenames
                    (without extension)
+        max_workers: Maximum number of files written at once
+                     (default: up to MAX_WRITE_WORKERS)
     
     Returns:
-        List of paths to saved files
+        List of paths to saved files, in the order of data_dict
     """
     os.makedirs(output_dir, exist_ok=True)
-    saved_paths = []
     
+    jobs = []
     for name, df in data_dict.items():
         # Use custom filename if provided, otherwise use schema name
         base_filename = filenames.get(name, name.lower()) if filenames else name.lower()
         file_name = f"{base_filename}.{format}"
-        file_path = os.path.join(output_dir, file_name)
-        saved_path = save_dataframe(df, file_path)
-        saved_paths.append(saved_path)
+        jobs.append((df, os.path.join(output_dir, file_name)))
+    
+    if len(jobs) <= 1 or max_workers == 1:
+        return [save_dataframe(df, file_path) for df, file_path in jobs]
     
-    return saved_paths
+    workers = min(len(jobs), max_workers or MAX_WRITE_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # map preserves input order and re-raises the first write error
+        return list(executor.map(lambda job: save_dataframe(*job), jobs))
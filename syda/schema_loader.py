@@ -13,10 +13,12 @@ foreign key parsing of schemas. It also provides useful methods for accessing an
 manipulating the loaded schemas.
 """
 
-import json
+import copy
+import functools
 import os
 from typing import Dict, List, Optional, Tuple, Union, Type, Any
 from .schemas import validate_schema
+from .serialization import parse_json
 
 # Check if yaml is available
 try:
@@ -32,6 +34,21 @@ try:
 except ImportError:
     SQLALCH_INSTALLED = False
 
+@functools.lru_cache(maxsize=128)
+def _parse_schema_file(file_path: str, file_type: str, mtime_ns: int, size: int) -> Any:
+    """
+    Read and parse a JSON or YAML schema file.
+
+    The modification time and size are part of the cache key, so an edited file is
+    parsed again while unchanged files are read only once per process.
+    """
+    if file_type == "JSON":
+        with open(file_path, 'rb') as f:
+            return parse_json(f.read())
+    with open(file_path, 'r') as f:
+        return yaml.safe_load(f)
+
+
 class SchemaLoader:
     """
     Load and process schemas in various formats:
@@ -209,30 +226,23 @@ class SchemaLoader:
         # Load file based on extension
         file_ext = os.path.splitext(file_path)[1].lower()
         
-        # JSON file
         if file_ext in ['.json', '.schema']:
-            try:
-                with open(file_path, 'r') as f:
-                    schema_dict = json.load(f)
-                    return schema_dict
-            except Exception as e:
-                raise ValueError(f"Error loading JSON schema file {file_path}: {str(e)}")
-                
-        # YAML file
+            file_type = "JSON"
         elif file_ext in ['.yml', '.yaml']:
             if not YAML_INSTALLED:
                 raise ImportError("PyYAML is required for YAML schema support. Install it with 'pip install pyyaml'.")
-            
-            try:
-                with open(file_path, 'r') as f:
-                    schema_dict = yaml.safe_load(f)
-                    return schema_dict
-            except Exception as e:
-                raise ValueError(f"Error loading YAML schema file {file_path}: {str(e)}")
-        
-        # Unsupported file type
+            file_type = "YAML"
         else:
             raise ValueError(f"Unsupported schema file type: {file_ext} for file {file_path}")
+        
+        try:
+            file_stat = os.stat(file_path)
+            schema_dict = _parse_schema_file(file_path, file_type, file_stat.st_mtime_ns, file_stat.st_size)
+        except Exception as e:
+            raise ValueError(f"Error loading {file_type} schema file {file_path}: {str(e)}")
+        
+        # The parsed file is cached and shared, so callers get their own copy
+        return copy.deepcopy(schema_dict)
          
     def _load_sqlalchemy_model(self, model_class: Type) -> Dict:
         """
@@ -45,6 +45,11 @@ class ModelConfig(BaseModel):
     # Anthropic specific parameters
     max_tokens_to_sample: Optional[int] = Field(None, description="Maximum tokens to generate (Anthropic only)")
 
+    # Rate limiting and retry parameters for concurrent batched generation
+    max_requests_per_minute: Optional[int] = Field(None, gt=0, description="Maximum requests per minute sent to the provider. None disables request throttling.")
+    max_tokens_per_minute: Optional[int] = Field(None, gt=0, description="Maximum tokens per minute sent to the provider. None disables token throttling.")
+    max_retries: int = Field(3, ge=0, description="Number of retries for requests that fail with rate-limit (429) or server (5xx) errors")
+
     # Extra kwargs for provider-specific configuration (e.g., azure_endpoint, http_client, base_url etc.)
     extra_kwargs: Optional[Dict[str, Any]] = Field(None, description="Additional provider-specific kwargs for client initialization")
     
@@ -0,0 +1,54 @@
+"""
+JSON serialization helpers.
+
+This module has no heavy dependencies so that lightweight modules such as
+syda.validators can use it without importing pandas or the provider SDKs.
+"""
+
+import json
+from typing import Any, Union
+
+# Optional fast JSON serializer
+try:
+    import orjson
+    ORJSON_INSTALLED = True
+except ImportError:
+    ORJSON_INSTALLED = False
+
+
+def canonical_json(obj: Any) -> str:
+    """
+    Serialize an object to JSON with sorted keys, for hashing and cache keys.
+
+    Uses orjson when it is installed. Values that aren't JSON serializable are
+    converted with str(). Both paths produce the same compact output, so cache
+    keys built from it don't depend on whether orjson is installed.
+    """
+    if ORJSON_INSTALLED:
+        try:
+            # Dates and dataclasses go through str() like in the stdlib path
+            return orjson.dumps(
+                obj,
+                default=str,
+                option=(orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                        | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+            ).decode('utf-8')
+        except TypeError:
+            # e.g. dicts with keys that orjson can't sort; fall back to the stdlib
+            pass
+    return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def parse_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    Input orjson rejects but the stdlib accepts (such as NaN) is parsed with
+    the stdlib json module.
+    """
+    if ORJSON_INSTALLED:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
@@ -2,6 +2,7 @@
 Template handling for unstructured data generation.
 """
 
+import functools
 import re
 import os
 from pathlib import Path
@@ -10,9 +11,26 @@ from sqlalchemy import Column, inspect
 import jinja2
 
 
+@functools.lru_cache(maxsize=32)
+def _get_jinja_environment(template_dir: str) -> jinja2.Environment:
+    """
+    Return the Jinja2 environment for templates in a directory.
+
+    Environments are reused so each template is compiled once; the loader reloads
+    a template when its file changes.
+    """
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(template_dir),
+        autoescape=jinja2.select_autoescape(['html', 'xml'])
+    )
+
+
 class TemplateProcessor:
     """Process document templates with placeholders and generate synthetic data."""
     
+    # Compiled once and shared by all instances
+    placeholder_pattern = re.compile(r'{{\s*([a-zA-Z0-9_]+)\s*}}')
+    
     def __init__(self, file_processor=None):
         """
         Initialize the template processor.
@@ -25,7 +43,6 @@ class TemplateProcessor:
         from .unstructured import UnstructuredDataProcessor
         
         self.file_processor = file_processor or UnstructuredDataProcessor()
-        self.placeholder_pattern = re.compile(r'{{\s*([a-zA-Z0-9_]+)\s*}}')
         
     def extract_placeholders(self, text: str) -> Set[str]:
         """
@@ -135,11 +152,8 @@ class TemplateProcessor:
         template_dir = os.path.dirname(os.path.abspath(template_path))
         template_file = os.path.basename(template_path)
         
-        # Set up Jinja2 environment
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(template_dir),
-            autoescape=jinja2.select_autoescape(['html', 'xml'])
-        )
+        # Reuse the Jinja2 environment (and its compiled templates) for this directory
+        env = _get_jinja_environment(template_dir)
         
         try:
             # Load and render the template
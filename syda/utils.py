@@ -8,6 +8,7 @@ import string
 from datetime import datetime, date, timedelta
 from sqlalchemy import inspect as sqla_inspect, Column
 from typing import Dict, Optional, Any, Union
+from .serialization import canonical_json
 
 def create_empty_dataframe(schema: Dict[str, str]) -> pd.DataFrame:
     """Create an empty pandas DataFrame with columns matching the schema types."""
@@ -240,13 +240,398 @@ Coverage:
 For more examples, see docs/examples/schema_validators_usage.md
 """
 
+import copy
+import difflib
+import functools
+import hashlib
 import os
 import re
-from typing import Dict, List, Tuple, Any, Set, Optional
+import stat
+import sys
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Any, Set, FrozenSet, Optional, Iterable, Union
 from dataclasses import dataclass, field
 
+from .serialization import canonical_json
 
-@dataclass
+try:
+    import hyperscan
+    HYPERSCAN_INSTALLED = True
+except ImportError:
+    HYPERSCAN_INSTALLED = False
+
+try:
+    from rapidfuzz import fuzz as rapidfuzz_fuzz, process as rapidfuzz_process
+    RAPIDFUZZ_INSTALLED = True
+except ImportError:
+    RAPIDFUZZ_INSTALLED = False
+
+try:
+    import jinja2
+    JINJA2_INSTALLED = True
+except ImportError:
+    JINJA2_INSTALLED = False
+
+
+# Schema sets at least this large that include template schemas are validated
+# from a thread pool, so that template file reads of different schemas overlap
+PARALLEL_VALIDATION_THRESHOLD = 8
+MAX_VALIDATION_WORKERS = 8
+
+# Number of recent validate_schemas results each SchemaValidator keeps
+_VALIDATION_CACHE_SIZE = 32
+
+
+def _schemas_fingerprint(schemas: Dict[str, Any], strict: bool) -> Optional[str]:
+    """
+    Build a fingerprint of the schemas for caching validation results.
+
+    Template files are part of the fingerprint through their absolute path,
+    modification time and size, so editing a template (or resolving a relative
+    path from another working directory) invalidates the cached result.
+
+    Returns:
+        Hex digest, or None if the schemas can't be serialized
+    """
+    template_stats = {}
+    for schema in schemas.values():
+        if isinstance(schema, dict):
+            template_path = schema.get('__template_source__')
+            if isinstance(template_path, str):
+                try:
+                    file_stat = os.stat(template_path)
+                    file_info = (os.path.abspath(template_path), file_stat.st_mtime_ns, file_stat.st_size)
+                except (OSError, ValueError):
+                    file_info = None
+                template_stats[template_path] = file_info
+    try:
+        payload = canonical_json({'schemas': schemas, 'strict': strict, 'templates': template_stats})
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _normalize_fk(fk_info: Any) -> Optional[Tuple[Any, Any]]:
+    """
+    Read the target of a foreign key definition.
+
+    Accepts the ('schema', 'column') form and the dict form with schema/column or
+    target_schema/target_column keys.
+
+    Returns:
+        Tuple of (target schema, target column), either of which may be None if the
+        dict form leaves it out, or None if the definition has neither form
+    """
+    if isinstance(fk_info, (list, tuple)) and len(fk_info) == 2:
+        return fk_info[0], fk_info[1]
+    if isinstance(fk_info, dict):
+        return (
+            fk_info.get('schema') or fk_info.get('target_schema'),
+            fk_info.get('column') or fk_info.get('target_column')
+        )
+    return None
+
+
+def _build_schema_index(all_schemas: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Index the field names and foreign keys of every schema once.
+
+    Returns:
+        Dict mapping schema name to {"all": frozenset of all keys, "public": tuple
+        of keys that aren't __metadata__ entries, "fks": tuple of (field, definition,
+        normalized target) for each foreign key}
+    """
+    index = {}
+    for name, schema in all_schemas.items():
+        keys = schema.keys() if isinstance(schema, dict) else ()
+        fks = schema.get('__foreign_keys__') if isinstance(schema, dict) else None
+        index[name] = {
+            "all": frozenset(keys),
+            "public": tuple(k for k in keys if not k.startswith('__')),
+            "fks": tuple(
+                (fk_field, fk_info, _normalize_fk(fk_info)) for fk_field, fk_info in fks.items()
+            ) if isinstance(fks, dict) else (),
+        }
+    return index
+
+
+def _build_fk_targets(schema_index: Dict[str, Dict[str, Any]]) -> FrozenSet[Tuple[str, str]]:
+    """Build the set of (schema, column) pairs a foreign key may reference."""
+    return frozenset(
+        (name, column) for name, fields in schema_index.items() for column in fields["all"]
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _lowercase_lookup(candidates: Tuple[str, ...]) -> Dict[str, str]:
+    """Map lowercased names to the original names (first occurrence wins)."""
+    lookup = {}
+    for candidate in candidates:
+        lookup.setdefault(candidate.lower(), candidate)
+    return lookup
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Return the set of three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+@functools.lru_cache(maxsize=256)
+def _trigram_index(names: Tuple[str, ...]) -> Tuple[Dict[str, List[str]], List[str], Dict[str, int]]:
+    """
+    Build an inverted trigram index of (lowercased) names.
+
+    Returns:
+        Tuple of (trigram -> names containing it, names shorter than three
+        characters, name -> position in names)
+    """
+    postings: Dict[str, List[str]] = {}
+    short_names = []
+    for name in names:
+        if len(name) < 3:
+            short_names.append(name)
+        for gram in _trigrams(name):
+            postings.setdefault(gram, []).append(name)
+    return postings, short_names, {name: i for i, name in enumerate(names)}
+
+
+def _find_similar_names(target: str, candidates: Tuple[str, ...], max_results: int) -> List[str]:
+    """
+    Find names similar to target for "did you mean" suggestions.
+
+    A case-insensitive exact match wins. Otherwise the closest names by
+    similarity ratio (rapidfuzz when installed, difflib otherwise) are returned,
+    falling back to substring matches.
+    """
+    lookup = _lowercase_lookup(candidates)
+    target_lower = target.lower()
+    
+    if target_lower in lookup:
+        return [lookup[target_lower]]
+    
+    if RAPIDFUZZ_INSTALLED:
+        close = [
+            name for name, _, _ in rapidfuzz_process.extract(
+                target_lower, lookup.keys(), scorer=rapidfuzz_fuzz.ratio,
+                limit=max_results, score_cutoff=60
+            )
+        ]
+    else:
+        close = difflib.get_close_matches(target_lower, lookup.keys(), n=max_results, cutoff=0.6)
+    if close:
+        return [lookup[name] for name in close]
+    
+    if len(target_lower) < 3:
+        pool = lookup.keys()
+    else:
+        # Only names sharing a trigram with the target (or too short to have one)
+        # can contain or be contained in it
+        postings, short_names, positions = _trigram_index(tuple(lookup))
+        pool = set(short_names)
+        for gram in _trigrams(target_lower):
+            pool.update(postings.get(gram, ()))
+        pool = sorted(pool, key=positions.__getitem__)
+    
+    substring_matches = [
+        lookup[lowered] for lowered in pool
+        if target_lower in lowered or lowered in target_lower
+    ]
+    return substring_matches[:max_results]
+
+
+_PLACEHOLDER_PATTERN = re.compile(r'{{\s*([a-zA-Z0-9_]+)\s*}}')
+_JINJA_ENV = jinja2.Environment() if JINJA2_INSTALLED else None
+
+
+@functools.lru_cache(maxsize=128)
+def _analyze_template(text: str) -> Tuple[bool, Optional[str], FrozenSet[str]]:
+    """
+    Analyze a template once, returning its syntax status and placeholder names.
+
+    Placeholders are the plain {{ name }} expressions matched by the placeholder
+    regex. The template is parsed with the shared Jinja2 environment only to check
+    its syntax.
+
+    Returns:
+        Tuple of (syntax is valid, syntax error message, placeholder names)
+    """
+    placeholders = frozenset(_PLACEHOLDER_PATTERN.findall(text))
+    if _JINJA_ENV is None:
+        # jinja2 not installed, skip syntax validation
+        return True, None, placeholders
+    
+    try:
+        _JINJA_ENV.parse(text)
+    except jinja2.TemplateSyntaxError as e:
+        return False, str(e), placeholders
+    return True, None, placeholders
+
+
+@functools.lru_cache(maxsize=128)
+def _load_template_cached(path: str, mtime_ns: int, size: int) -> Tuple[bool, Optional[str], FrozenSet[str]]:
+    """
+    Read and analyze a template file.
+
+    The modification time and size are part of the cache key, so an edited file is
+    read again while unchanged files (e.g. one template shared by several schemas)
+    are read and parsed only once.
+
+    Raises:
+        IOError, UnicodeDecodeError: If the file can't be read
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return _analyze_template(content)
+
+
+def _build_fk_graph(
+    all_schemas: Dict[str, Any],
+    schema_index: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, List[str]]:
+    """
+    Build the foreign key dependency graph as an adjacency list.
+
+    Args:
+        all_schemas: All schemas
+        schema_index: Optional index from _build_schema_index, whose parsed foreign
+                      keys are reused
+
+    Returns:
+        Dict mapping each schema name to the schemas it references, in
+        all_schemas order
+    """
+    if schema_index is None:
+        schema_index = _build_schema_index(all_schemas)
+    graph = {name: [] for name in all_schemas}
+    for name, entry in schema_index.items():
+        if not entry["fks"]:
+            continue
+        # dict keys dedupe the targets while keeping their order
+        targets = {}
+        for _, _, target in entry["fks"]:
+            if target is None:
+                continue
+            target_schema = target[0]
+            if isinstance(target_schema, str) and target_schema in graph:
+                targets[target_schema] = None
+        graph[name] = list(targets)
+    return graph
+
+
+def _tarjan_iterative(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Find the strongly connected components of a graph with Tarjan's algorithm.
+
+    Uses an explicit stack of (node, neighbor iterator) frames instead of
+    recursion, so it runs in O(V + E) without depending on the recursion limit.
+
+    Returns:
+        List of components, each a list of node names
+    """
+    index = {}
+    lowlink = {}
+    on_stack = set()
+    stack = []
+    components = []
+    counter = 0
+    
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph[root]))]
+        
+        while work:
+            node, neighbors = work[-1]
+            advanced = False
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = lowlink[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(graph[neighbor])))
+                    advanced = True
+                    break
+                if neighbor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[neighbor])
+            if advanced:
+                continue
+            
+            # All neighbors done: pop the frame and propagate lowlink to the parent
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component[::-1])
+    
+    return components
+
+
+def _find_cycle(graph: Dict[str, List[str]], start: str, members: Set[str]) -> List[str]:
+    """Find a cycle through start that stays within one strongly connected component."""
+    # Breadth-first search back to start gives the shortest cycle through it
+    parents = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for neighbor in graph[node]:
+            if neighbor == start:
+                cycle = [node]
+                while parents[cycle[-1]] is not None:
+                    cycle.append(parents[cycle[-1]])
+                return cycle[::-1]
+            if neighbor in members and neighbor not in parents:
+                parents[neighbor] = node
+                queue.append(neighbor)
+    return [start]
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_pattern(pattern: str) -> Union[re.Pattern, re.error]:
+    """Compile a regex pattern once, returning the compiled pattern or the re.error it raised."""
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        return e
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_hyperscan_database(pattern: str):
+    """Compile a pattern into a Hyperscan block-mode database, or None if Hyperscan can't handle it."""
+    try:
+        database = hyperscan.Database()
+        # UTF8 and UCP make '.', \w, \d and \s match characters like re does for str
+        # patterns, instead of single bytes and ASCII only
+        database.compile(
+            expressions=[pattern.encode('utf-8')],
+            ids=[0],
+            elements=1,
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP]
+        )
+        return database
+    except Exception:
+        # Unsupported constructs (e.g. backreferences, lookarounds) fall back to re
+        return None
+
+
+# Slotted dataclasses need Python 3.10+; older versions keep a regular dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationResult:
     """Results from schema validation.
     
@@ -287,25 +672,55 @@ class ValidationResult:
     errors: Dict[str, List[str]] = field(default_factory=dict)
     warnings: Dict[str, List[str]] = field(default_factory=dict)
     suggestions: List[str] = field(default_factory=list)
+    _seen_suggestions: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Set mirror of suggestions so add_suggestion dedups in constant time
+        self._seen_suggestions = set(self.suggestions)
     
     def add_error(self, schema_name: str, error: str):
         """Add an error for a schema."""
-        if schema_name not in self.errors:
-            self.errors[schema_name] = []
-        self.errors[schema_name].append(error)
+        self.errors.setdefault(schema_name, []).append(error)
         self.error_count += 1
         self.is_valid = False
     
     def add_warning(self, schema_name: str, warning: str):
         """Add a warning for a schema."""
-        if schema_name not in self.warnings:
-            self.warnings[schema_name] = []
-        self.warnings[schema_name].append(warning)
+        self.warnings.setdefault(schema_name, []).append(warning)
         self.warning_count += 1
     
+    def add_errors(self, schema_name: str, errors: List[str]):
+        """Add several errors for a schema at once."""
+        self.errors.setdefault(schema_name, []).extend(errors)
+        self.error_count += len(errors)
+        if errors:
+            self.is_valid = False
+    
+    def add_warnings(self, schema_name: str, warnings: List[str]):
+        """Add several warnings for a schema at once."""
+        self.warnings.setdefault(schema_name, []).extend(warnings)
+        self.warning_count += len(warnings)
+    
+    def promote_warnings_to_errors(self):
+        """Turn all warnings into errors marked "(Strict mode)", as strict validation does."""
+        if not self.warnings:
+            return
+        for schema_name, warnings in self.warnings.items():
+            self.add_errors(schema_name, [f"(Strict mode) {warning}" for warning in warnings])
+        self.warnings = {}
+        self.warning_count = 0
+    
+    def contains_error(self, text: str) -> bool:
+        """Check case-insensitively whether any error mentions text."""
+        text = text.casefold()
+        return any(
+            text in str(error).casefold() for errors in self.errors.values() for error in errors
+        )
+    
     def add_suggestion(self, suggestion: str):
         """Add a suggestion for fixing issues."""
-        if suggestion not in self.suggestions:
+        if suggestion not in self._seen_suggestions:
+            self._seen_suggestions.add(suggestion)
             self.suggestions.append(suggestion)
     
     def summary(self) -> str:
@@ -321,21 +736,18 @@ class ValidationResult:
             for schema_name, errors in self.errors.items():
                 if errors:
                     lines.append(f"  {schema_name}:")
-                    for error in errors:
-                        lines.append(f"    ❌ {error}")
+                    lines.extend(f"    ❌ {error}" for error in errors)
             
             # Print warnings
             for schema_name, warnings in self.warnings.items():
                 if warnings:
                     lines.append(f"  {schema_name}:")
-                    for warning in warnings:
-                        lines.append(f"    ⚠️  {warning}")
+                    lines.extend(f"    ⚠️  {warning}" for warning in warnings)
             
             # Print suggestions
             if self.suggestions:
-                lines.append(f"\n💡 SUGGESTIONS:")
-                for suggestion in self.suggestions:
-                    lines.append(f"  ✓ {suggestion}")
+                lines.append("\n💡 SUGGESTIONS:")
+                lines.extend(f"  ✓ {suggestion}" for suggestion in self.suggestions)
         
         return "\n".join(lines)
 
@@ -447,8 +859,10 @@ class ForeignKeyValidator:
         self.validated_tables = set()
         self.all_schemas = {}
     
-    def _singularize(self, table_name: str) -> str:
-        """Convert table name to singular form (basic heuristic)."""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _singularize(table_name: str) -> str:
+        """Convert table name to singular form (basic heuristic, cached per name)."""
         # Handle common pluralization patterns
         if table_name.endswith('ies'):
             return table_name[:-3] + 'y'
@@ -460,32 +874,23 @@ class ForeignKeyValidator:
     
     def _get_expected_fk_pattern(self, target_schema: str) -> str:
         """Get expected FK field naming pattern for a target schema."""
-        singular = self._singularize(target_schema)
-        return f"{singular}_id"
+        return f"{self._singularize(target_schema)}_id"
     
     def _is_naming_convention_likely_valid(self, fk_field: str, target_schema: str) -> bool:
         """Check if FK field name follows common naming conventions."""
-        expected_pattern = self._get_expected_fk_pattern(target_schema)
-        
-        # Allow exact match
-        if fk_field == expected_pattern:
+        # The expected '<singular>_id' and the '<target_schema>_id' variations all end
+        # in '_id', so the suffix check covers them without building them per call
+        if fk_field == "id":  # Single column FK is valid
             return True
-        
-        # Allow common variations
-        variations = [
-            expected_pattern,
-            f"{target_schema}_id",
-            f"{target_schema.lower()}_id",
-            "id",  # Single column FK is valid
-        ]
-        
-        return fk_field in variations or fk_field.endswith("_id")
+        return fk_field.endswith("_id")
     
     def validate_foreign_keys(
         self,
         schema_name: str,
         schema: Dict[str, Any],
-        all_schemas: Dict[str, Dict[str, Any]]
+        all_schemas: Dict[str, Dict[str, Any]],
+        schema_index: Optional[Dict[str, Dict[str, Any]]] = None,
+        valid_targets: Optional[FrozenSet[Tuple[str, str]]] = None
     ) -> Tuple[List[str], List[str]]:
         """
         Validate all foreign keys in a schema.
@@ -500,6 +905,10 @@ class ForeignKeyValidator:
             schema_name: Name of the schema being validated
             schema: Schema definition containing field definitions and __foreign_keys__
             all_schemas: All schemas for cross-reference validation
+            schema_index: Optional field index of all_schemas from _build_schema_index;
+                          pass it when validating many schemas so it's built only once
+            valid_targets: Optional set of (schema, column) pairs from _build_fk_targets,
+                           likewise shared across schemas
             
         Returns:
             Tuple of (errors, warnings) where:
@@ -585,18 +994,26 @@ class ForeignKeyValidator:
         if not fks:
             return errors, warnings
         
-        for fk_field, fk_info in fks.items():
+        if schema_index is None:
+            schema_index = _build_schema_index(all_schemas)
+        if valid_targets is None:
+            valid_targets = _build_fk_targets(schema_index)
+        
+        # Reuse the foreign keys parsed by the index when it describes this schema
+        entry = schema_index.get(schema_name)
+        if entry is not None and all_schemas.get(schema_name) is schema:
+            parsed_fks = entry["fks"]
+        else:
+            parsed_fks = [(fk_field, fk_info, _normalize_fk(fk_info)) for fk_field, fk_info in fks.items()]
+        
+        for fk_field, fk_info, target in parsed_fks:
             # Handle both tuple and dict formats
-            if isinstance(fk_info, (list, tuple)) and len(fk_info) == 2:
-                target_schema, target_column = fk_info
-            elif isinstance(fk_info, dict):
-                target_schema = fk_info.get('schema') or fk_info.get('target_schema')
-                target_column = fk_info.get('column') or fk_info.get('target_column')
-            else:
+            if target is None:
                 errors.append(
                     f"FK: Invalid foreign key definition for '{fk_field}': {fk_info}"
                 )
                 continue
+            target_schema, target_column = target
             
             # Skip if schema/column not extractable
             if not target_schema or not target_column:
@@ -611,36 +1028,29 @@ class ForeignKeyValidator:
                     f"FK: Foreign key field '{fk_field}' is not defined in schema"
                 )
             
-            # Validate target schema exists
-            if target_schema not in all_schemas:
-                errors.append(
-                    f"FK: Field '{fk_field}' references non-existent schema '{target_schema}'"
-                )
+            # Validate target schema and column exist; valid references need only one
+            # set lookup, the schema/column lookups below only run to explain errors
+            if (target_schema, target_column) not in valid_targets:
+                if target_schema not in all_schemas:
+                    errors.append(
+                        f"FK: Field '{fk_field}' references non-existent schema '{target_schema}'"
+                    )
+                    
+                    # Suggest similar schema names
+                    similar = self._find_similar_schema_names(target_schema, all_schemas.keys())
+                    errors.extend(f"FK:    (Did you mean '{suggestion}'?)" for suggestion in similar)
+                    continue
                 
-                # Suggest similar schema names
-                similar = self._find_similar_schema_names(target_schema, all_schemas.keys())
-                if similar:
-                    for suggestion in similar:
-                        errors.append(
-                            f"FK:    (Did you mean '{suggestion}'?)"
-                        )
-                continue
-            
-            # Validate target column exists in target schema
-            target_schema_def = all_schemas[target_schema]
-            if target_column not in target_schema_def:
                 errors.append(
                     f"FK: Field '{fk_field}' references non-existent column "
                     f"'{target_schema}.{target_column}'"
                 )
                 
                 # Suggest similar columns
-                similar = self._find_similar_field_names(target_column, target_schema_def.keys())
-                if similar:
-                    for suggestion in similar:
-                        errors.append(
-                            f"FK:    (Did you mean '{target_schema}.{suggestion}'?)"
-                        )
+                similar = self._find_similar_field_names(target_column, schema_index[target_schema]["public"])
+                errors.extend(
+                    f"FK:    (Did you mean '{target_schema}.{suggestion}'?)" for suggestion in similar
+                )
             
             # Check naming convention (warning, not error)
             if not self._is_naming_convention_likely_valid(fk_field, target_schema):
@@ -656,33 +1066,15 @@ class ForeignKeyValidator:
         """Find similar schema names for suggestions."""
         if not target:
             return []
-        
-        candidates = list(candidates)
-        target_lower = target.lower()
-        
-        # Exact case-insensitive match
-        exact_matches = [c for c in candidates if c.lower() == target_lower]
-        if exact_matches:
-            return exact_matches[:max_results]
-        
-        # Substring matches
-        substring_matches = [c for c in candidates if target_lower in c.lower() or c.lower() in target_lower]
-        return substring_matches[:max_results]
+        return _find_similar_names(target, tuple(candidates), max_results)
     
     @staticmethod
     def _find_similar_field_names(target: str, candidates: Any, max_results: int = 2) -> List[str]:
         """Find similar field names for suggestions."""
-        candidates = [c for c in candidates if not c.startswith('__')]
-        target_lower = target.lower()
-        
-        # Exact case-insensitive match
-        exact_matches = [c for c in candidates if c.lower() == target_lower]
-        if exact_matches:
-            return exact_matches[:max_results]
-        
-        # Substring matches
-        substring_matches = [c for c in candidates if target_lower in c.lower() or c.lower() in target_lower]
-        return substring_matches[:max_results]
+        if not target:
+            return []
+        candidates = tuple(c for c in candidates if not c.startswith('__'))
+        return _find_similar_names(target, candidates, max_results)
 
 
 class TemplateValidator:
@@ -783,33 +1175,23 @@ class TemplateValidator:
         template. Either remove unused fields or add them to the template.
     """
     
-    def __init__(self):
-        """Initialize the template validator."""
-        self.placeholder_pattern = re.compile(r'{{\s*([a-zA-Z0-9_]+)\s*}}')
-        self.jinja_pattern = re.compile(r'{%.*?%}|{#.*?#}')
+    # Shared by all instances
+    placeholder_pattern = _PLACEHOLDER_PATTERN
     
     def _extract_placeholders(self, text: str) -> Set[str]:
         """Extract all placeholder field names from text."""
-        return set(self.placeholder_pattern.findall(text))
+        return set(_analyze_template(text)[2])
     
     def _is_jinja_syntax_valid(self, text: str) -> Tuple[bool, Optional[str]]:
         """Validate Jinja2 syntax in text."""
-        try:
-            import jinja2
-            # Try to parse the template
-            env = jinja2.Environment()
-            env.parse(text)
-            return True, None
-        except jinja2.TemplateSyntaxError as e:
-            return False, str(e)
-        except ImportError:
-            # jinja2 not installed, skip validation
-            return True, None
+        is_valid, error_msg, _ = _analyze_template(text)
+        return is_valid, error_msg
     
     def validate_templates(
         self,
         schema_name: str,
-        schema: Dict[str, Any]
+        schema: Dict[str, Any],
+        field_names: Optional[Iterable[str]] = None
     ) -> Tuple[List[str], List[str]]:
         """
         Validate template-related schema fields.
@@ -824,6 +1206,8 @@ class TemplateValidator:
         Args:
             schema_name: Name of the schema
             schema: Schema definition
+            field_names: Optional precomputed names of the schema's data fields
+                         (keys that aren't __metadata__ entries)
             
         Returns:
             Tuple of (errors, warnings) where:
@@ -897,64 +1281,69 @@ class TemplateValidator:
             >>> assert len(warnings) > 0  # Warning about 'description'
             >>> assert 'not used in template' in warnings[0].lower()
         """
-        errors = []
-        warnings = []
-        
         # Check if this is a template schema
         if '__template_source__' not in schema:
-            return errors, warnings  # Not a template schema
+            return [], []  # Not a template schema
+        
+        errors = []
+        warnings = []
         
         template_path = schema['__template_source__']
         
         # Validate template file exists
-        if not os.path.exists(template_path):
+        try:
+            file_stat = os.stat(template_path)
+        except (OSError, TypeError, ValueError):
             errors.append(
                 f"Template: File not found: '{template_path}'"
             )
             return errors, warnings
         
         # Validate file is readable
-        if not os.path.isfile(template_path):
+        if not stat.S_ISREG(file_stat.st_mode):
             errors.append(
                 f"Template: '{template_path}' is not a file"
             )
             return errors, warnings
         
+        # Read and parse the template once for both placeholders and syntax
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Absolute path, so a relative path read from another working
+            # directory isn't served the other file's cached result
+            is_valid, error_msg, placeholders = _load_template_cached(
+                os.path.abspath(template_path), file_stat.st_mtime_ns, file_stat.st_size
+            )
         except (IOError, UnicodeDecodeError) as e:
             errors.append(
                 f"Template: Unable to read file: {str(e)}"
             )
             return errors, warnings
         
-        # Extract placeholders
-        placeholders = self._extract_placeholders(content)
-        
         if not placeholders:
             warnings.append(
                 f"Template: No placeholders found in template"
             )
         
         # Validate each placeholder exists in schema
-        schema_fields = {k: v for k, v in schema.items() if not k.startswith('__')}
+        if field_names is None:
+            schema_field_keys = {k for k in schema if not k.startswith('__')}
+        else:
+            schema_field_keys = set(field_names)
         
-        for placeholder in placeholders:
-            if placeholder not in schema_fields:
-                errors.append(
-                    f"Template: Placeholder '{{{{ {placeholder} }}}}' is not defined in schema"
-                )
+        # Sorted, since placeholders come from a set and reports should be reproducible
+        for placeholder in sorted(placeholders - schema_field_keys):
+            errors.append(
+                f"Template: Placeholder '{{{{ {placeholder} }}}}' is not defined in schema"
+            )
         
         # Check for schema fields not used in template
-        unused_fields = set(schema_fields.keys()) - placeholders
+        unused_fields = schema_field_keys - placeholders
         if unused_fields:
             warnings.append(
                 f"Template: Schema fields not used in template: {', '.join(sorted(unused_fields))}"
             )
         
         # Validate Jinja2 syntax
-        is_valid, error_msg = self._is_jinja_syntax_valid(content)
         if not is_valid:
             errors.append(
                 f"Template: Invalid Jinja2 syntax: {error_msg}"
@@ -1103,7 +1492,7 @@ class ConstraintValidator:
         ✅ All constraints valid!
     """
     
-    VALID_FIELD_TYPES = {
+    VALID_FIELD_TYPES = frozenset({
         'integer', 'number', 'float', 'decimal',
         'text', 'string',
         'email', 'phone', 'url',
@@ -1112,7 +1501,10 @@ class ConstraintValidator:
         'json', 'dict',
         'foreign_key',
         'id', 'uuid'
-    }
+    })
+    
+    # Listed in unknown-type warnings
+    _VALID_TYPES_SORTED_STR = ', '.join(sorted(VALID_FIELD_TYPES))
     
     def __init__(self):
         """Initialize the constraint validator."""
@@ -1254,57 +1646,177 @@ class ConstraintValidator:
             
             # Validate field type
             if isinstance(field_def, str):
-                if field_def.lower() not in self.VALID_FIELD_TYPES:
+                # Most types are already lowercase; only lowercase the others
+                if field_def not in self.VALID_FIELD_TYPES and field_def.lower() not in self.VALID_FIELD_TYPES:
                     warnings.append(
                         f"Constraint: Field '{field_name}' has unknown type '{field_def}' "
-                        f"(valid types: {', '.join(sorted(self.VALID_FIELD_TYPES))})"
+                        f"(valid types: {self._VALID_TYPES_SORTED_STR})"
                     )
             
-            # Validate constraints if defined
-            if isinstance(field_def, dict):
+            # Validate constraints if defined, in a fixed order: range, pattern, length
+            elif isinstance(field_def, dict):
                 constraints = field_def.get('constraints', {})
-                
-                # Numeric constraint validation
-                if 'min' in constraints and 'max' in constraints:
-                    try:
-                        min_val = float(constraints['min'])
-                        max_val = float(constraints['max'])
-                        
-                        if min_val > max_val:
-                            errors.append(
-                                f"Constraint: Field '{field_name}' has min ({min_val}) > max ({max_val})"
-                            )
-                    except (ValueError, TypeError) as e:
-                        errors.append(
-                            f"Constraint: Field '{field_name}' has invalid numeric constraints: {str(e)}"
-                        )
-                
-                # String pattern validation
-                if 'pattern' in constraints:
-                    try:
-                        re.compile(constraints['pattern'])
-                    except re.error as e:
-                        errors.append(
-                            f"Constraint: Field '{field_name}' has invalid regex pattern: {str(e)}"
-                        )
-                
-                # String length validation
-                if 'min_length' in constraints and 'max_length' in constraints:
-                    try:
-                        min_len = int(constraints['min_length'])
-                        max_len = int(constraints['max_length'])
-                        
-                        if min_len > max_len:
-                            errors.append(
-                                f"Constraint: Field '{field_name}' has min_length ({min_len}) > max_length ({max_len})"
-                            )
-                    except (ValueError, TypeError) as e:
-                        errors.append(
-                            f"Constraint: Field '{field_name}' has invalid length constraints: {str(e)}"
-                        )
+                if not constraints:
+                    continue
+                for trigger, check in self._CONSTRAINT_CHECKS:
+                    if trigger in constraints:
+                        error = check(field_name, constraints)
+                        if error:
+                            errors.append(error)
         
         return errors, warnings
 
+    @staticmethod
+    def _check_numeric_range(field_name: str, constraints: Dict[str, Any]) -> Optional[str]:
+        """Check that min <= max when both are given."""
+        if 'min' not in constraints or 'max' not in constraints:
+            return None
+        try:
+            min_val = float(constraints['min'])
+            max_val = float(constraints['max'])
+        except (ValueError, TypeError) as e:
+            return f"Constraint: Field '{field_name}' has invalid numeric constraints: {str(e)}"
+        if min_val > max_val:
+            return f"Constraint: Field '{field_name}' has min ({min_val}) > max ({max_val})"
+        return None
+
+    @staticmethod
+    def _check_length_range(field_name: str, constraints: Dict[str, Any]) -> Optional[str]:
+        """Check that min_length <= max_length when both are given."""
+        if 'min_length' not in constraints or 'max_length' not in constraints:
+            return None
+        try:
+            min_len = int(constraints['min_length'])
+            max_len = int(constraints['max_length'])
+        except (ValueError, TypeError) as e:
+            return f"Constraint: Field '{field_name}' has invalid length constraints: {str(e)}"
+        if min_len > max_len:
+            return f"Constraint: Field '{field_name}' has min_length ({min_len}) > max_length ({max_len})"
+        return None
+
+    @staticmethod
+    def _check_pattern(field_name: str, constraints: Dict[str, Any]) -> Optional[str]:
+        """Check that the regex pattern compiles."""
+        compiled = _compile_pattern(constraints['pattern'])
+        if isinstance(compiled, re.error):
+            return f"Constraint: Field '{field_name}' has invalid regex pattern: {str(compiled)}"
+        return None
+
+    # (constraint that triggers the check, check) in reporting order; the range
+    # checks need both bounds, so one of each pair is enough as the trigger
+    _CONSTRAINT_CHECKS = (
+        ('min', _check_numeric_range.__func__),
+        ('pattern', _check_pattern.__func__),
+        ('min_length', _check_length_range.__func__),
+    )
+
+    def validate_column(self, values: Iterable[Any], pattern: str) -> List[int]:
+        """
+        Check a column of generated values against a regex pattern constraint.
+
+        Uses Hyperscan when it is installed and supports the pattern, and the
+        cached compiled ``re`` pattern otherwise. Matching follows ``re.search``
+        semantics, so anchor the pattern with ``^...$`` to require a full match.
+        None values are skipped.
+
+        Args:
+            values: Values of one column
+            pattern: Regex pattern from the field's constraints
+
+        Returns:
+            Indices (positions in ``values``) of the values that don't match
+
+        Raises:
+            ValueError: If the pattern is not a valid regex
+
+        Example:
+
+            >>> validator = ConstraintValidator()
+            >>> validator.validate_column(['ABC-12345', 'bad', 'XYZ-00001'], '^[A-Z]{3}-[0-9]{5}$')
+            [1]
+        """
+        compiled = _compile_pattern(pattern)
+        if isinstance(compiled, re.error):
+            raise ValueError(f"Invalid regex pattern '{pattern}': {compiled}")
+
+        database = _compile_hyperscan_database(pattern) if HYPERSCAN_INSTALLED else None
+        if database is not None:
+            def matches(text: str) -> bool:
+                found = []
+
+                def on_match(match_id, start, end, flags, context):
+                    # SINGLEMATCH reports the pattern only once. Returning True
+                    # would stop the scan by raising ScanTerminated.
+                    found.append(True)
+
+                database.scan(text.encode('utf-8'), match_event_handler=on_match)
+                return bool(found)
+        else:
+            search = compiled.search
+
+            def matches(text: str) -> bool:
+                return search(text) is not None
+
+        return [
+            index for index, value in enumerate(values)
+            if value is not None and not matches(str(value))
+        ]
+
+    def validate_column_bounds(self, values: Iterable[Any], constraints: Dict[str, Any]) -> List[int]:
+        """
+        Check a column of generated values against min/max and length constraints.
+
+        The comparisons run on NumPy arrays rather than value by value, so large
+        batches are checked in a few vectorized operations. ``min``/``max`` bound
+        the numeric value and ``min_length``/``max_length`` bound the length of the
+        string form; either bound may be given on its own. None values are skipped.
+
+        Args:
+            values: Values of one column
+            constraints: The field's constraints dictionary
+
+        Returns:
+            Indices (positions in ``values``) of the values outside the bounds
+
+        Raises:
+            ValueError: If min/max are given and a value is not numeric
+
+        Example:
+
+            >>> validator = ConstraintValidator()
+            >>> validator.validate_column_bounds([5, 150, None, -1], {'min': 0, 'max': 120})
+            [1, 3]
+        """
+        # Imported here so that importing the validators stays lightweight
+        import numpy as np
+
+        values = list(values)
+        violations = np.zeros(len(values), dtype=bool)
+
+        if 'min' in constraints or 'max' in constraints:
+            try:
+                # None becomes NaN, which fails every comparison and is thus skipped
+                numbers = np.array(values, dtype=float)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Column has non-numeric values for min/max constraints: {e}")
+            if 'min' in constraints:
+                violations |= numbers < float(constraints['min'])
+            if 'max' in constraints:
+                violations |= numbers > float(constraints['max'])
+
+        if 'min_length' in constraints or 'max_length' in constraints:
+            lengths = np.fromiter(
+                (-1 if value is None else len(str(value)) for value in values),
+                dtype=np.int64, count=len(values)
+            )
+            present = lengths >= 0
+            if 'min_length' in constraints:
+                violations |= present & (lengths < int(constraints['min_length']))
+            if 'max_length' in constraints:
+                violations |= present & (lengths > int(constraints['max_length']))
+
+        return np.flatnonzero(violations).tolist()
+
 
 class CircularDependencyValidator:
     """Validates for circular dependencies in foreign keys.
@@ -1391,16 +1903,99 @@ class CircularDependencyValidator:
         ...     print("✅ No circular dependencies!")
         ✅ No circular dependencies!
     
-    Note: Requires networkx library for graph analysis. Falls back to no validation
-    if networkx is not available.
+    Note: Cycles are found with an iterative strongly-connected-components pass
+    over the foreign key graph, without requiring networkx.
     """
     
+    @staticmethod
+    def build_graph(
+        all_schemas: Dict[str, Dict[str, Any]],
+        schema_index: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Build the foreign key dependency graph of all schemas.
+        
+        Args:
+            all_schemas: All schemas
+            schema_index: Optional prebuilt schema index, so the foreign keys
+                          parsed for the FK checks are reused
+            
+        Returns:
+            Dict mapping each schema name to the schemas it references
+        """
+        return _build_fk_graph(all_schemas, schema_index)
+    
+    @staticmethod
+    def analyze_graph(graph: Dict[str, List[str]]) -> Tuple[List[List[str]], Dict[str, float]]:
+        """
+        Find the cycles and dependency chain lengths of the graph in one Tarjan pass.
+        
+        Tarjan's algorithm yields components in reverse topological order, so every
+        schema's dependencies are measured before the schema itself. A component
+        with more than one schema, or a schema referencing itself, is a cycle; its
+        schemas and the schemas depending on them get infinity as chain length.
+        
+        Args:
+            graph: Dependency graph from build_graph
+            
+        Returns:
+            Tuple of (cycles as returned by detect_cycles, chain lengths as returned
+            by dependency_heights)
+        """
+        cycles = []
+        heights: Dict[str, float] = {}
+        for component in _tarjan_iterative(graph):
+            node = component[0]
+            if len(component) > 1 or node in graph[node]:
+                members = set(component)
+                first = next(name for name in graph if name in members)
+                cycles.append(_find_cycle(graph, first, members))
+                for member in component:
+                    heights[member] = float('inf')
+                continue
+            heights[node] = max((heights[target] + 1 for target in graph[node]), default=0)
+        return cycles, heights
+    
+    @staticmethod
+    def detect_cycles(graph: Dict[str, List[str]]) -> List[List[str]]:
+        """
+        Find one cycle in each strongly connected component of the graph.
+        
+        Each cycle starts with the first of its schemas in graph order, which is
+        the schema the cycle is reported under.
+        
+        Args:
+            graph: Dependency graph from build_graph
+            
+        Returns:
+            List of cycles, each a list of schema names
+        """
+        return CircularDependencyValidator.analyze_graph(graph)[0]
+    
+    @staticmethod
+    def dependency_heights(graph: Dict[str, List[str]]) -> Dict[str, float]:
+        """
+        Compute the length of the longest dependency chain starting at each schema.
+        
+        Schemas in or depending on a cycle get infinity.
+        
+        Args:
+            graph: Dependency graph from build_graph
+            
+        Returns:
+            Dict mapping each schema name to its longest chain length
+        """
+        return CircularDependencyValidator.analyze_graph(graph)[1]
+    
     def validate_circular_dependencies(
         self,
         schema_name: str,
         schema: Dict[str, Any],
         all_schemas: Dict[str, Dict[str, Any]],
-        max_depth: int = 10
+        max_depth: int = 10,
+        graph: Optional[Dict[str, List[str]]] = None,
+        cycles: Optional[List[List[str]]] = None,
+        heights: Optional[Dict[str, float]] = None
     ) -> Tuple[List[str], List[str]]:
         """
         Validate that foreign keys don't create circular dependencies.
@@ -1414,6 +2009,13 @@ class CircularDependencyValidator:
             schema: Schema definition
             all_schemas: All schemas for graph traversal
             max_depth: Maximum allowed dependency depth (default: 10)
+            graph: Optional prebuilt graph from build_graph, so callers checking
+                   every schema build it only once
+            cycles: Optional cycles from analyze_graph or detect_cycles for the
+                    same graph
+            heights: Optional chain lengths from analyze_graph or dependency_heights
+                     for the same graph; schemas whose longest chain is within
+                     max_depth skip the depth search
             
         Returns:
             Tuple of (errors, warnings) where:
@@ -1424,8 +2026,9 @@ class CircularDependencyValidator:
             None - returns errors in the list instead
         
         Note:
-            Requires networkx library for graph analysis. Falls back gracefully
-            if networkx is not installed.
+            The dependency graph is analyzed with an iterative Tarjan SCC pass, so
+            deep schema graphs can't hit Python's recursion limit. Each cycle is
+            reported once, by the first of its schemas in all_schemas order.
         
         Example - Valid (No Circular Dependencies):
         
@@ -1491,49 +2094,42 @@ class CircularDependencyValidator:
         errors = []
         warnings = []
         
-        try:
-            import networkx as nx
-            
-            # Build dependency graph
-            graph = nx.DiGraph()
-            
-            for sname, sdef in all_schemas.items():
-                graph.add_node(sname)
-                fks = sdef.get('__foreign_keys__', {})
-                
-                for fk_field, fk_info in fks.items():
-                    if isinstance(fk_info, (list, tuple)) and len(fk_info) == 2:
-                        target_schema = fk_info[0]
-                    elif isinstance(fk_info, dict):
-                        target_schema = fk_info.get('schema') or fk_info.get('target_schema')
-                    else:
-                        continue
-                    
-                    if target_schema in all_schemas:
-                        graph.add_edge(sname, target_schema)
-            
-            # Check for cycles
-            if not nx.is_directed_acyclic_graph(graph):
-                cycles = list(nx.simple_cycles(graph))
-                for cycle in cycles:
-                    cycle_str = ' → '.join(cycle) + f' → {cycle[0]}'
-                    errors.append(
-                        f"Circular dependency detected: {cycle_str}"
+        # Without foreign keys the schema has no outgoing edges, so it can't start a
+        # cycle or a dependency chain and the graph isn't needed
+        fks = schema.get('__foreign_keys__') if isinstance(schema, dict) else None
+        if not isinstance(fks, dict) or not fks:
+            return errors, warnings
+        
+        if graph is None:
+            graph = self.build_graph(all_schemas)
+        if cycles is None:
+            cycles = self.detect_cycles(graph)
+        
+        # Report each cycle once, under the first of its schemas in all_schemas order
+        for cycle in cycles:
+            if cycle[0] == schema_name:
+                cycle_str = ' → '.join((*cycle, cycle[0]))
+                errors.append(
+                    f"Circular dependency detected: {cycle_str}"
+                )
+        
+        # Check for deep dependencies using breadth-first shortest path lengths. No
+        # shortest path can be longer than the longest chain, so short ones are skipped.
+        if schema_name in graph and (heights is None or heights[schema_name] > max_depth):
+            depths = {schema_name: 0}
+            queue = deque([schema_name])
+            while queue:
+                node = queue.popleft()
+                for target in graph[node]:
+                    if target not in depths:
+                        depths[target] = depths[node] + 1
+                        queue.append(target)
+            for target, path_length in depths.items():
+                if target != schema_name and path_length > max_depth:
+                    warnings.append(
+                        f"Deep dependency chain detected for '{schema_name}' "
+                        f"(depth: {path_length}, max recommended: {max_depth})"
                     )
-            
-            # Check for deep dependencies
-            if schema_name in graph:
-                for target in nx.descendants(graph, schema_name):
-                    path_length = nx.shortest_path_length(graph, schema_name, target)
-                    if path_length > max_depth:
-                        warnings.append(
-                            f"Deep dependency chain detected for '{schema_name}' "
-                            f"(depth: {path_length}, max recommended: {max_depth})"
-                        )
-        
-        except ImportError:
-            # networkx not available, skip validation
-            pass
         
         return errors, warnings
 
@@ -1726,11 +2322,15 @@ class SchemaValidator:
         self.template_validator = TemplateValidator()
         self.constraint_validator = ConstraintValidator()
         self.circular_validator = CircularDependencyValidator()
+        # Recent results of this validator, see validate_schemas
+        self._validation_cache: "OrderedDict[Tuple, ValidationResult]" = OrderedDict()
     
     def validate_schemas(
         self,
         schemas: Dict[str, Dict[str, Any]],
-        strict: bool = False
+        strict: bool = False,
+        fail_fast: bool = False,
+        parallel: Optional[bool] = None
     ) -> ValidationResult:
         """
         Validate all schemas before generation.
@@ -1743,6 +2343,15 @@ class SchemaValidator:
                    Key: schema name (str)
                    Value: schema definition (Dict[str, Any])
             strict: If True, treat all warnings as errors
+            fail_fast: If True, stop at the first check that reports an error (or a
+                       warning in strict mode). Useful when only result.is_valid is
+                       needed, e.g. in CI gates; the result then only holds the
+                       errors found up to that point.
+            parallel: Whether to check schemas from a thread pool. None (default)
+                      uses one for sets of PARALLEL_VALIDATION_THRESHOLD or more
+                      schemas that include templates, whose file reads overlap;
+                      True always does, False never does. Results are the same
+                      either way. Ignored with fail_fast, which runs serially.
             
         Returns:
             ValidationResult object with:
@@ -1934,80 +2543,171 @@ class SchemaValidator:
             ... else:
             ...     # Show errors before attempting generation
             ...     print(result.summary())
+        
+        Each validator caches its results by a fingerprint of the schemas (and the
+        paths and modification times of referenced template files), so validating
+        the same schemas again with the same validator returns a copy of the
+        earlier result without re-running the validators. Results computed before
+        one of the sub-validators (fk_validator, template_validator, ...) was
+        replaced are not reused. Partial fail_fast results are not cached.
         """
+        fingerprint = _schemas_fingerprint(schemas, strict) if schemas else None
+        cache_key = None
+        if fingerprint is not None:
+            cache_key = (fingerprint, self.fk_validator, self.template_validator,
+                         self.constraint_validator, self.circular_validator)
+            if cache_key in self._validation_cache:
+                self._validation_cache.move_to_end(cache_key)
+                return copy.deepcopy(self._validation_cache[cache_key])
+        
+        if fail_fast:
+            return self._validate_schemas(schemas, strict, fail_fast=True)
+        
+        result = self._validate_schemas(schemas, strict, parallel=parallel)
+        
+        if cache_key is not None:
+            self._validation_cache[cache_key] = copy.deepcopy(result)
+            while len(self._validation_cache) > _VALIDATION_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
+        
+        return result
+    
+    def _validate_one(
+        self,
+        schema_name: str,
+        schema: Any,
+        schemas: Dict[str, Dict[str, Any]],
+        schema_index: Dict[str, Dict[str, Any]],
+        valid_targets: FrozenSet[Tuple[str, str]],
+        graph: Dict[str, List[str]],
+        cycles: List[List[str]],
+        heights: Dict[str, float],
+        strict: bool = False,
+        fail_fast: bool = False
+    ) -> Tuple[List[str], List[str]]:
+        """Run all validators on one schema and return its (errors, warnings)."""
+        errors: List[str] = []
+        warnings: List[str] = []
+        
+        def should_stop() -> bool:
+            return fail_fast and bool(errors or (strict and warnings))
+        
+        if not isinstance(schema, dict):
+            errors.append(f"Schema must be a dictionary, got {type(schema).__name__}")
+            return errors, warnings
+        
+        # Data field names were collected once by the schema index
+        field_names = schema_index[schema_name]["public"]
+        if not field_names:
+            errors.append("Schema must define at least one data field (not just metadata)")
+            if should_stop():
+                return errors, warnings
+        
+        # Foreign keys, templates, constraints, then circular dependencies. The
+        # FK and circular checks only find something in schemas with foreign keys
+        # (a cycle is reported by one of its members), and the template check only
+        # in template schemas, so they're skipped for plain schemas.
+        has_fks = bool(schema.get('__foreign_keys__'))
+        checks = []
+        if has_fks:
+            checks.append((self.fk_validator.validate_foreign_keys,
+                           (schema_name, schema, schemas, schema_index, valid_targets)))
+        if '__template_source__' in schema:
+            checks.append((self.template_validator.validate_templates, (schema_name, schema, field_names)))
+        checks.append((self.constraint_validator.validate_constraints, (schema_name, schema)))
+        if has_fks:
+            checks.append((self.circular_validator.validate_circular_dependencies,
+                           (schema_name, schema, schemas, 10, graph, cycles, heights)))
+        for check, args in checks:
+            check_errors, check_warnings = check(*args)
+            errors.extend(check_errors)
+            warnings.extend(check_warnings)
+            if should_stop():
+                break
+        
+        return errors, warnings
+    
+    def _validate_schemas(
+        self,
+        schemas: Dict[str, Dict[str, Any]],
+        strict: bool,
+        fail_fast: bool = False,
+        parallel: Optional[bool] = None
+    ) -> ValidationResult:
+        """Run all validators on the schemas (uncached implementation of validate_schemas)."""
         result = ValidationResult()
         
         if not schemas:
             result.add_error("__global__", "No schemas provided")
             return result
         
-        # Validate each schema
-        for schema_name, schema in schemas.items():
-            if not isinstance(schema, dict):
-                result.add_error(schema_name, f"Schema must be a dictionary, got {type(schema)}")
-                continue
-            
-            # Count non-metadata fields
-            field_count = sum(1 for k in schema.keys() if not k.startswith('__'))
-            if field_count == 0:
-                result.add_error(schema_name, "Schema must define at least one data field (not just metadata)")
-            
-            # Validate foreign keys
-            fk_errors, fk_warnings = self.fk_validator.validate_foreign_keys(
-                schema_name, schema, schemas
-            )
-            for error in fk_errors:
-                result.add_error(schema_name, error)
-            for warning in fk_warnings:
-                result.add_warning(schema_name, warning)
-            
-            # Validate templates
-            template_errors, template_warnings = self.template_validator.validate_templates(
-                schema_name, schema
-            )
-            for error in template_errors:
-                result.add_error(schema_name, error)
-            for warning in template_warnings:
-                result.add_warning(schema_name, warning)
-            
-            # Validate constraints
-            constraint_errors, constraint_warnings = self.constraint_validator.validate_constraints(
-                schema_name, schema
-            )
-            for error in constraint_errors:
-                result.add_error(schema_name, error)
-            for warning in constraint_warnings:
-                result.add_warning(schema_name, warning)
-            
-            # Validate circular dependencies
-            circular_errors, circular_warnings = self.circular_validator.validate_circular_dependencies(
-                schema_name, schema, schemas
-            )
-            for error in circular_errors:
-                result.add_error(schema_name, error)
-            for warning in circular_warnings:
-                result.add_warning(schema_name, warning)
+        # Field names of every schema, shared by the foreign key checks of all schemas
+        schema_index = _build_schema_index(schemas)
+        valid_targets = _build_fk_targets(schema_index)
         
-        # Add suggestions for common issues
+        # The dependency graph and its cycles are likewise found once for all schemas,
+        # and not at all when no schema has foreign keys
+        if any(entry["fks"] for entry in schema_index.values()):
+            graph = self.circular_validator.build_graph(schemas, schema_index)
+            cycles, heights = self.circular_validator.analyze_graph(graph)
+        else:
+            graph, cycles, heights = {}, [], {}
+        
+        # Schemas are checked independently, so by default large sets are checked
+        # concurrently when there are template files to read. The other checks are
+        # CPU-bound and don't gain from threads. fail_fast stops at the first failing
+        # schema and always runs serially.
+        if parallel is None:
+            parallel = (len(schemas) >= PARALLEL_VALIDATION_THRESHOLD
+                        and any(isinstance(schema, dict) and '__template_source__' in schema
+                                for schema in schemas.values()))
+        if parallel and not fail_fast:
+            workers = min(MAX_VALIDATION_WORKERS, os.cpu_count() or 1, len(schemas))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(
+                    lambda item: self._validate_one(
+                        item[0], item[1], schemas, schema_index, valid_targets, graph, cycles, heights
+                    ),
+                    schemas.items()
+                ))
+        else:
+            outcomes = []
+            for schema_name, schema in schemas.items():
+                outcomes.append(self._validate_one(
+                    schema_name, schema, schemas, schema_index, valid_targets, graph, cycles, heights,
+                    strict, fail_fast
+                ))
+                errors, warnings = outcomes[-1]
+                if fail_fast and (errors or (strict and warnings)):
+                    break
+        
+        # Merge in schema order, so the result doesn't depend on which thread finished first
+        for schema_name, (errors, warnings) in zip(schemas, outcomes):
+            if errors:
+                result.add_errors(schema_name, errors)
+            if warnings:
+                result.add_warnings(schema_name, warnings)
+        
+        # Add suggestions for common issues, lowercasing the error text only once
         if result.errors:
-            if any('naming convention' in str(e).lower() for errors in result.errors.values() for e in errors):
+            error_text = "\n".join(
+                str(e) for errors in result.errors.values() for e in errors
+            ).lower()
+            if 'naming convention' in error_text:
                 result.add_suggestion(
                     "Use explicit foreign key definitions instead of relying on naming convention inference"
                 )
-            if any('not found' in str(e).lower() or 'non-existent' in str(e).lower() for errors in result.errors.values() for e in errors):
+            if 'not found' in error_text or 'non-existent' in error_text:
                 result.add_suggestion(
                     "Verify all schema names and column names match exactly (case-sensitive)"
                 )
-            if any('template' in str(e).lower() for errors in result.errors.values() for e in errors):
+            if 'template' in error_text:
                 result.add_suggestion(
                     "Ensure template files exist and all placeholders are defined in the schema"
                 )
         
         # If strict mode, convert warnings to errors
-        if strict and result.warnings:
-            for schema_name, warnings in result.warnings.items():
-                for warning in warnings:
-                    result.add_error(schema_name, f"(Strict mode) {warning}")
-            result.warnings = {}
+        if strict:
+            result.promote_warnings_to_errors()
         
         return result
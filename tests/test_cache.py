@@ -0,0 +1,138 @@
+"""
+Tests for the cache module.
+"""
+import os
+import pytest
+import shutil
+import tempfile
+import threading
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from syda.cache import ResponseCache
+from syda.generate import SyntheticDataGenerator
+from syda.schemas import ModelConfig
+
+
+class TestResponseCache:
+    """Tests for the ResponseCache class."""
+
+    def setup_method(self):
+        self.schema = {'id': 'integer', 'name': 'text'}
+        self.cache = ResponseCache()
+
+    def _key(self, **overrides):
+        args = dict(
+            table_schema=self.schema,
+            metadata={},
+            table_description="Customers",
+            prompt="Generate customers",
+            model_name="gpt-4o",
+            temperature=0.1,
+        )
+        args.update(overrides)
+        return ResponseCache.make_key(**args)
+
+    def test_key_is_stable_across_dict_order(self):
+        reordered = {'name': 'text', 'id': 'integer'}
+        assert self._key() == self._key(table_schema=reordered)
+
+    def test_key_changes_with_inputs(self):
+        assert self._key() != self._key(prompt="Generate other customers")
+        assert self._key() != self._key(model_name="gpt-4o-mini")
+        assert self._key() != self._key(temperature=0.2)
+        assert self._key() != self._key(batch_index=1)
+
+    def test_key_rounds_temperature(self):
+        assert self._key(temperature=0.1) == self._key(temperature=0.1001)
+
+    def test_enabled_only_for_low_temperature(self):
+        assert self.cache.is_enabled_for(0.0)
+        assert self.cache.is_enabled_for(0.3)
+        assert not self.cache.is_enabled_for(0.7)
+        assert not self.cache.is_enabled_for(None)
+
+    def test_get_subsamples_cached_records(self):
+        key = self._key()
+        self.cache.put(key, pd.DataFrame({'id': range(10)}))
+
+        df = self.cache.get(key, 4)
+        assert list(df['id']) == [0, 1, 2, 3]
+        assert self.cache.hits == 1
+
+    def test_get_misses_when_too_few_records(self):
+        key = self._key()
+        self.cache.put(key, pd.DataFrame({'id': range(3)}))
+
+        assert self.cache.get(key, 5) is None
+        assert self.cache.misses == 1
+
+    def test_max_entries_evicts_oldest(self):
+        cache = ResponseCache(max_entries=1)
+        cache.put("a", pd.DataFrame({'id': [1]}))
+        cache.put("b", pd.DataFrame({'id': [2]}))
+
+        assert cache.get("a", 1) is None
+        assert cache.get("b", 1) is not None
+
+    def test_persists_to_cache_dir(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            key = self._key()
+            ResponseCache(cache_dir=cache_dir).put(key, pd.DataFrame({'id': [1, 2]}))
+            assert os.path.exists(os.path.join(cache_dir, f"{key}.json"))
+
+            df = ResponseCache(cache_dir=cache_dir).get(key, 2)
+            assert list(df['id']) == [1, 2]
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_concurrent_identical_requests_are_coalesced(self):
+        key = self._key()
+        release = threading.Event()
+        calls = []
+
+        def generate():
+            calls.append(1)
+            release.wait(5)
+            return pd.DataFrame({'id': [1, 2, 3]})
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(self.cache.get_or_generate, key, 3, generate) for _ in range(4)]
+            # Let the waiting callers register before the first request completes
+            while not self.cache._inflight:
+                pass
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert [reused for _, reused in results].count(False) == 1
+        assert all(len(df) == 3 for df, _ in results)
+        assert not self.cache._inflight
+
+    def test_coalesced_error_is_propagated(self):
+        def generate():
+            raise ValueError("LLM failed")
+
+        with pytest.raises(ValueError, match="LLM failed"):
+            self.cache.get_or_generate(self._key(), 3, generate)
+        assert not self.cache._inflight
+        assert self.cache.get(self._key(), 1) is None
+
+    def test_generator_reuses_cached_response(self):
+        generator = SyntheticDataGenerator(
+            model_config=ModelConfig(provider="openai", model_name="gpt-4", temperature=0.0),
+            openai_api_key="test_key",
+            response_cache=self.cache
+        )
+        generator._generate_data_with_llm = MagicMock(
+            return_value=pd.DataFrame({'id': [1, 2, 3], 'name': ['a', 'b', 'c']})
+        )
+
+        first = generator._generate_data(self.schema, {}, "Customers", "Generate customers", 3)
+        second = generator._generate_data(self.schema, {}, "Customers", "Generate customers", 2)
+
+        assert generator._generate_data_with_llm.call_count == 1
+        assert len(first) == 3
+        assert list(second['name']) == ['a', 'b']
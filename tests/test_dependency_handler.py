@@ -260,4 +260,25 @@ class TestForeignKeyHandler:
         # Check that the result is invalid due to the reference to non-existent id
         assert is_valid is False
     
+    def test_verify_referential_integrity_reports_invalid_rows(self, capsys):
+        """Test that invalid references are reported with their row indices and nulls are ignored."""
+        handler = ForeignKeyHandler(generator_manager=MagicMock())
+
+        extracted_foreign_keys = {
+            "Order": {
+                "customer_id": ("Customer", "id")
+            }
+        }
+
+        customer_df = pd.DataFrame({"id": [1, 2, 3]})
+        order_df = pd.DataFrame({"customer_id": [1, None, 7, 7, 2]})
+        results = {"Customer": customer_df, "Order": order_df}
+
+        is_valid = handler.verify_referential_integrity(results, extracted_foreign_keys)
+
+        assert is_valid is False
+        output = capsys.readouterr().out
+        assert "Found 1 invalid references" in output
+        assert "Invalid rows: [2, 3]" in output
+
     # End of TestForeignKeyHandler class
@@ -0,0 +1,107 @@
+"""
+Tests for the dispatcher module.
+"""
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from syda.dispatcher import ParallelRequestDispatcher, estimate_tokens, is_retryable_error
+from syda.schemas import ModelConfig
+
+
+class StatusError(Exception):
+    """Exception carrying an HTTP status code, like the provider SDK errors."""
+
+    def __init__(self, status_code):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+class TestRetryableErrors:
+    """Tests for transient error detection."""
+
+    def test_rate_limit_is_retryable(self):
+        assert is_retryable_error(StatusError(429))
+
+    def test_server_error_is_retryable(self):
+        assert is_retryable_error(StatusError(503))
+
+    def test_client_error_is_not_retryable(self):
+        assert not is_retryable_error(StatusError(400))
+        assert not is_retryable_error(ValueError("bad schema"))
+
+    def test_wrapped_error_is_retryable(self):
+        """Errors wrapped in ValueError by the generator are still detected."""
+        try:
+            try:
+                raise StatusError(429)
+            except StatusError as e:
+                raise ValueError(f"Error generating data: {e}")
+        except ValueError as wrapped:
+            assert is_retryable_error(wrapped)
+
+
+class TestParallelRequestDispatcher:
+    """Tests for the ParallelRequestDispatcher class."""
+
+    def test_from_model_config(self):
+        config = ModelConfig(
+            provider="openai",
+            model_name="gpt-4o",
+            max_requests_per_minute=60,
+            max_tokens_per_minute=1000,
+            max_retries=2
+        )
+        dispatcher = ParallelRequestDispatcher.from_model_config(config)
+        assert dispatcher.max_requests_per_minute == 60
+        assert dispatcher.max_tokens_per_minute == 1000
+        assert dispatcher.max_retries == 2
+
+    def test_capacity_is_consumed(self):
+        dispatcher = ParallelRequestDispatcher(max_requests_per_minute=2, max_tokens_per_minute=100)
+        assert dispatcher._try_consume(40) == 0.0
+        assert dispatcher._try_consume(40) == 0.0
+        # Out of request capacity: must wait for roughly one refill interval
+        assert dispatcher._try_consume(10) > 0
+
+    def test_token_capacity_wait(self):
+        dispatcher = ParallelRequestDispatcher(max_tokens_per_minute=60)
+        assert dispatcher._try_consume(60) == 0.0
+        wait = dispatcher._try_consume(30)
+        assert 25 < wait <= 30
+
+    def test_unlimited_dispatcher_never_waits(self):
+        dispatcher = ParallelRequestDispatcher()
+        for _ in range(100):
+            assert dispatcher._try_consume(10_000) == 0.0
+
+    def test_submit_retries_transient_errors(self):
+        dispatcher = ParallelRequestDispatcher(max_retries=2, base_delay=0.001)
+        func = MagicMock(side_effect=[StatusError(429), StatusError(500), "ok"])
+
+        result = asyncio.run(dispatcher.submit(func, 1, key="value"))
+
+        assert result == "ok"
+        assert func.call_count == 3
+        func.assert_called_with(1, key="value")
+
+    def test_submit_gives_up_after_max_retries(self):
+        dispatcher = ParallelRequestDispatcher(max_retries=1, base_delay=0.001)
+        func = MagicMock(side_effect=StatusError(429))
+
+        with pytest.raises(StatusError):
+            asyncio.run(dispatcher.submit(func))
+        assert func.call_count == 2
+
+    def test_submit_does_not_retry_other_errors(self):
+        dispatcher = ParallelRequestDispatcher(max_retries=3, base_delay=0.001)
+        func = MagicMock(side_effect=ValueError("Missing column"))
+
+        with pytest.raises(ValueError, match="Missing column"):
+            asyncio.run(dispatcher.submit(func))
+        assert func.call_count == 1
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("a" * 400) == 100
@@ -1,4 +1,5 @@
 import os
+import time
 import pytest
 import pandas as pd
 import networkx as nx
@@ -431,3 +432,197 @@ class TestSyntheticDataGenerator:
             # Test that the exception is properly propagated
             with pytest.raises(Exception, match="Simulated client error"):
                 generator.generate_for_schemas({"customers": test_schema}, default_sample_size=10)
+
+    def test_generate_with_batches(self):
+        """Test that large sample sizes are split into concurrent batches."""
+        test_schema = {'id': {'type': 'number'}}
+
+        generator = SyntheticDataGenerator(
+            model_config=ModelConfig(provider="openai", model_name="gpt-4"),
+            openai_api_key="test_key"
+        )
+        generator.schema_loader = MagicMock()
+        generator.schema_loader.load_schema.return_value = (test_schema, {}, "Test schema", {}, {}, [])
+        generator._generate_data = MagicMock(
+            side_effect=lambda **kwargs: pd.DataFrame({'id': range(kwargs['sample_size'])})
+        )
+
+        results = generator.generate_for_schemas(
+            {"customers": test_schema},
+            sample_sizes={"customers": 10},
+            batch_size=4,
+            max_concurrency=2
+        )
+
+        batch_sizes = sorted(c.kwargs['sample_size'] for c in generator._generate_data.call_args_list)
+        assert batch_sizes == [2, 4, 4]
+        assert len(results["customers"]) == 10
+        assert list(results["customers"].index) == list(range(10))
+
+    def test_generate_for_schemas_async(self):
+        """Test the async entry point from inside an event loop."""
+        import asyncio
+
+        test_schema = {'id': {'type': 'number'}}
+
+        generator = SyntheticDataGenerator(
+            model_config=ModelConfig(provider="openai", model_name="gpt-4"),
+            openai_api_key="test_key"
+        )
+        generator.schema_loader = MagicMock()
+        generator.schema_loader.load_schema.return_value = (test_schema, {}, "Test schema", {}, {}, [])
+        generator._generate_data = MagicMock(return_value=pd.DataFrame({'id': [1, 2]}))
+
+        results = asyncio.run(generator.generate_for_schemas_async(
+            {"customers": test_schema},
+            sample_sizes={"customers": 2}
+        ))
+
+        assert generator._generate_data.call_count == 1
+        assert len(results["customers"]) == 2
+
+    def test_prompt_prefix_is_independent_of_sample_size(self, sample_schema):
+        """Test that only the prompt suffix changes with the sample size."""
+        generator = SyntheticDataGenerator(
+            model_config=ModelConfig(provider="openai", model_name="gpt-4"),
+            openai_api_key="test_key"
+        )
+
+        static_10, dynamic_10 = generator._build_prompt_parts(sample_schema, {}, "Customers", [], "Tech customers", 10)
+        static_50, dynamic_50 = generator._build_prompt_parts(sample_schema, {}, "Customers", [], "Tech customers", 50)
+
+        assert static_10 == static_50
+        assert "10" in dynamic_10 and "50" in dynamic_50
+        assert "Description: Tech customers" in static_10
+
+    def test_anthropic_messages_mark_cacheable_prefix(self):
+        """Test that Anthropic requests mark the static prompt block for caching."""
+        generator = SyntheticDataGenerator(
+            model_config=ModelConfig(provider="anthropic", model_name="claude-3"),
+            anthropic_api_key="test_key"
+        )
+
+        messages = generator._build_messages("static\ndynamic", ("static", "dynamic"))
+
+        content = messages[0]["content"]
+        assert content[0] == {"type": "text", "text": "static", "cache_control": {"type": "ephemeral"}}
+        assert content[1] == {"type": "text", "text": "dynamic"}
+
+        openai_generator = SyntheticDataGenerator(
+            model_config=ModelConfig(provider="openai", model_name="gpt-4"),
+            openai_api_key="test_key"
+        )
+        assert openai_generator._build_messages("static\ndynamic", ("static", "dynamic")) == [
+            {"role": "user", "content": "static\ndynamic"}
+        ]
+
+    def test_schema_prerequisites(self):
+        """Test which earlier schemas a schema has to wait for."""
+        generation_order = ["Customer", "Product", "Order", "Review"]
+        processed_schemas = {
+            "Customer": {"id": "number"},
+            "Product": {"id": "number", "name": "text"},
+            "Order": {"id": "number", "customer_id": "foreign_key"},
+            "Review": {"id": "number", "customer_id": "foreign_key", "text": "text"},
+        }
+        extracted_foreign_keys = {
+            "Order": {"customer_id": ("Customer", "id")},
+            "Review": {"customer_id": ("Customer", "id")},
+        }
+        dependencies = {"Order": ["Customer"], "Review": ["Customer"]}
+
+        prerequisites = SyntheticDataGenerator._schema_prerequisites(
+            generation_order, processed_schemas, extracted_foreign_keys, dependencies, {}
+        )
+
+        assert prerequisites["Customer"] == []
+        # Independent of Customer: can be generated at the same time
+        assert prerequisites["Product"] == []
+        assert prerequisites["Order"] == ["Customer"]
+        # Shares the customer_id foreign key column with Order
+        assert prerequisites["Review"] == ["Customer", "Order"]
+
+        # Custom generators that read parent dataframes wait for all earlier schemas
+        def pick_name(row, col_name, parent_dfs=None):
+            return "name"
+
+        prerequisites = SyntheticDataGenerator._schema_prerequisites(
+            generation_order, processed_schemas, extracted_foreign_keys, dependencies,
+            {"Product": {"name": pick_name}}
+        )
+        assert prerequisites["Product"] == ["Customer"]
+
+    def test_independent_schemas_keep_generation_order(self):
+        """Test that concurrently generated schemas are returned in generation order."""
+        test_schema = {'id': {'type': 'number'}}
+
+        generator = SyntheticDataGenerator(
+            model_config=ModelConfig(provider="openai", model_name="gpt-4"),
+            openai_api_key="test_key"
+        )
+        generator.schema_loader = MagicMock()
+        generator.schema_loader.load_schema.return_value = (test_schema, {}, "Test schema", {}, {}, [])
+        generator._generate_data = MagicMock(return_value=pd.DataFrame({'id': [1, 2]}))
+
+        results = generator.generate_for_schemas(
+            {"first": test_schema, "second": test_schema, "third": test_schema},
+            sample_sizes={"first": 2, "second": 2, "third": 2}
+        )
+
+        assert list(results.keys()) == ["first", "second", "third"]
+        assert generator._generate_data.call_count == 3
+
+    def test_output_files_written_per_schema(self, tmp_path):
+        """Test that each structured schema is saved to output_dir once generated."""
+        test_schema = {'id': {'type': 'number'}}
+
+        generator = SyntheticDataGenerator(
+            model_config=ModelConfig(provider="openai", model_name="gpt-4"),
+            openai_api_key="test_key"
+        )
+        generator.schema_loader = MagicMock()
+        generator.schema_loader.load_schema.return_value = (test_schema, {}, "Test schema", {}, {}, [])
+        generator._generate_data = MagicMock(return_value=pd.DataFrame({'id': [1, 2]}))
+
+        generator.generate_for_schemas(
+            {"Customers": test_schema, "Orders": test_schema},
+            default_sample_size=2,
+            output_dir=str(tmp_path)
+        )
+
+        assert sorted(os.listdir(tmp_path)) == ["customers.csv", "orders.csv"]
+        assert list(pd.read_csv(tmp_path / "orders.csv")["id"]) == [1, 2]
+
+    def test_output_files_removed_when_a_schema_fails(self, tmp_path):
+        """Test that files already written are removed when a later schema fails."""
+        test_schema = {'id': {'type': 'number'}}
+
+        generator = SyntheticDataGenerator(
+            model_config=ModelConfig(provider="openai", model_name="gpt-4"),
+            openai_api_key="test_key"
+        )
+        generator.schema_loader = MagicMock()
+        generator.schema_loader.load_schema.return_value = (test_schema, {}, "Test schema", {}, {}, [])
+
+        calls = []
+
+        def generate_data(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                return pd.DataFrame({'id': [1, 2]})
+            # Fail only after the first schema's file has been written
+            deadline = time.monotonic() + 5
+            while not os.listdir(tmp_path) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            raise ValueError("LLM request failed")
+
+        generator._generate_data = MagicMock(side_effect=generate_data)
+
+        with pytest.raises(Exception, match="LLM request failed"):
+            generator.generate_for_schemas(
+                {"Customers": test_schema, "Orders": test_schema},
+                default_sample_size=2,
+                output_dir=str(tmp_path)
+            )
+
+        assert os.listdir(tmp_path) == []
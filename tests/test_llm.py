@@ -146,6 +146,36 @@ class TestLLMClient:
         with pytest.raises(ValueError, match="Unsupported provider"):
             LLMClient(model_config=config)
 
+    @patch.dict('os.environ', {'AZURE_OPENAI_API_KEY': 'test_key'})
+    @patch('syda.llm.openai.AzureOpenAI')
+    @patch('syda.llm.instructor.from_openai')
+    def test_shared_http_client_is_passed_to_provider(self, mock_from_openai, mock_azure_client):
+        """Test that a shared http_client is forwarded to the provider client."""
+        http_client = MagicMock()
+        config = ModelConfig(
+            provider="azureopenai",
+            model_name="gpt-4o",
+            extra_kwargs={"azure_endpoint": "https://example.openai.azure.com/", "api_version": "2024-02-15-preview"}
+        )
+
+        LLMClient(model_config=config, http_client=http_client)
+
+        _, kwargs = mock_azure_client.call_args
+        assert kwargs["http_client"] is http_client
+        assert kwargs["azure_endpoint"] == "https://example.openai.azure.com/"
+
+    @patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'})
+    @patch('syda.llm.openai.OpenAI')
+    @patch('syda.llm.instructor.from_openai')
+    def test_extra_kwargs_http_client_takes_precedence(self, mock_from_openai, mock_openai_client):
+        """Test that an http_client set in extra_kwargs is not overridden."""
+        own_client = MagicMock()
+        config = ModelConfig(provider="openai", model_name="gpt-4o", extra_kwargs={"http_client": own_client})
+
+        LLMClient(model_config=config, http_client=MagicMock())
+
+        mock_openai_client.assert_called_once_with(http_client=own_client)
+
 
 class TestCreateLLMClient:
     """Tests for the create_llm_client function."""
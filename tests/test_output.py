@@ -184,6 +184,22 @@ class TestSaveDataframes:
             # Check that the directory was created
             mock_makedirs.assert_called_once_with(output_dir, exist_ok=True)
     
+    def test_save_dataframes_returns_paths_in_order(self, tmp_path):
+        """Test that concurrently written files are returned in input order."""
+        data = {f"Table{i}": pd.DataFrame({"id": [i]}) for i in range(5)}
+        
+        paths = save_dataframes(data, str(tmp_path), max_workers=3)
+        
+        assert [os.path.basename(p) for p in paths] == [f"table{i}.csv" for i in range(5)]
+        assert all(os.path.exists(p) for p in paths)
+    
+    def test_save_dataframes_propagates_write_errors(self, tmp_path):
+        """Test that an error writing one file is raised."""
+        data = {"Good": pd.DataFrame({"id": [1]}), "Empty": pd.DataFrame()}
+        
+        with pytest.raises(ValueError, match="empty"):
+            save_dataframes(data, str(tmp_path))
+    
     def test_save_dataframes_empty_dict(self):
         """Test saving an empty dictionary of DataFrames."""
         # Save an empty dictionary
@@ -119,6 +119,20 @@ class TestSchemaLoader:
             # Clean up
             os.unlink(tmp_path)
             
+    def test_load_schema_file_cached_until_modified(self, tmp_path):
+        """Test that a schema file is parsed once, re-read after edits and returned as a copy."""
+        schema_path = tmp_path / 'schema.json'
+        schema_path.write_text(json.dumps({'id': {'type': 'number'}}))
+        
+        loader = SchemaLoader()
+        first = loader._load_schema_file(str(schema_path))
+        first['id']['type'] = 'text'
+        assert loader._load_schema_file(str(schema_path)) == {'id': {'type': 'number'}}
+        
+        schema_path.write_text(json.dumps({'id': {'type': 'number'}, 'name': {'type': 'text'}}))
+        os.utime(schema_path, ns=(0, 0))
+        assert 'name' in loader._load_schema_file(str(schema_path))
+    
     def test_load_schema_unsupported_file_type(self):
         """Test error handling for unsupported file type."""
         # Create a temporary file with unsupported extension
@@ -1,12 +1,16 @@
 """
 Tests for the utils module.
 """
+import json
 import pytest
 import pandas as pd
 import random
+from datetime import date, datetime
 from unittest.mock import patch
 
+from syda import serialization
 from syda.utils import (
+    canonical_json,
     create_empty_dataframe,
     generate_random_value,
     get_schema_prompt,
@@ -232,3 +236,30 @@ class TestParseDataframeOutput:
         # Check that the DataFrame is empty but has the expected columns
         assert len(df) == 0
         assert set(df.columns) == set(["id", "name"])
+
+
+class TestCanonicalJson:
+    """Tests for the canonical_json function."""
+
+    def test_key_order_does_not_matter(self):
+        assert canonical_json({"b": 1, "a": {"d": 2, "c": 3}}) == canonical_json({"a": {"c": 3, "d": 2}, "b": 1})
+
+    def test_non_serializable_values_use_str(self):
+        assert "2024-01-02" in canonical_json({"when": date(2024, 1, 2)})
+
+    def test_round_trips(self):
+        data = {"schema": {"id": "integer"}, "batch": 2, "temperature": None}
+        assert json.loads(canonical_json(data)) == data
+
+    @pytest.mark.skipif(not serialization.ORJSON_INSTALLED, reason="orjson not installed")
+    def test_same_output_with_and_without_orjson(self, monkeypatch):
+        data = {
+            "schema": {"id": "integer", "name": "text", "nested": {"b": [1, 2.5, None], "a": True}},
+            "prompt": "Clientes en España — naïve café",
+            "temperature": 0.2,
+            "when": date(2024, 1, 2),
+            "at": datetime(2024, 1, 2, 3, 4, 5),
+        }
+        with_orjson = canonical_json(data)
+        monkeypatch.setattr(serialization, "ORJSON_INSTALLED", False)
+        assert canonical_json(data) == with_orjson
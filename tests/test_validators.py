@@ -4,27 +4,54 @@ Unit tests for the schema validators module.
 
 import pytest
 import os
-import tempfile
+import subprocess
+import sys
 from pathlib import Path
+from unittest.mock import MagicMock
 
+from syda import validators
 from syda.validators import (
     SchemaValidator,
     ForeignKeyValidator,
     TemplateValidator,
     ConstraintValidator,
     CircularDependencyValidator,
-    ValidationResult
+    ValidationResult,
+    _build_fk_targets,
+    _build_schema_index
 )
 
 
+def _lowered(messages):
+    """Join messages into one lowercased string for substring assertions."""
+    return "\n".join(str(m).lower() for m in messages)
+
+
+# The sub-validators keep no state between calls, so each test class shares one
+@pytest.fixture(scope="class")
+def fk_validator():
+    return ForeignKeyValidator()
+
+
+@pytest.fixture(scope="class")
+def template_validator():
+    return TemplateValidator()
+
+
+@pytest.fixture(scope="class")
+def constraint_validator():
+    return ConstraintValidator()
+
+
+@pytest.fixture(scope="class")
+def circular_validator():
+    return CircularDependencyValidator()
+
+
 class TestForeignKeyValidator:
     """Test cases for ForeignKeyValidator."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = ForeignKeyValidator()
-    
-    def test_valid_foreign_key(self):
+    def test_valid_foreign_key(self, fk_validator):
         """Should pass validation for valid FK."""
         schemas = {
             'customers': {
@@ -41,115 +68,154 @@ class TestForeignKeyValidator:
             }
         }
         
-        errors, warnings = self.validator.validate_foreign_keys(
+        errors, warnings = fk_validator.validate_foreign_keys(
             'orders', schemas['orders'], schemas
         )
         
         assert len(errors) == 0, f"Expected no errors, got: {errors}"
     
-    def test_missing_target_schema(self):
-        """Should error when FK references non-existent schema."""
+    @pytest.mark.parametrize(
+        "fk_target,fk_field_defined,expected_error_substring",
+        [
+            (('customer', 'id'), True, 'customer'),  # Wrong schema name
+            (('customers', 'customer_id'), True, 'column'),  # Wrong column
+            (('customers', 'id'), False, 'not defined'),  # FK field missing from schema
+        ],
+        ids=['missing_target_schema', 'missing_target_column', 'missing_fk_field_in_schema']
+    )
+    def test_invalid_foreign_key(self, fk_validator, fk_target, fk_field_defined, expected_error_substring):
+        """Should error when the FK target or the FK field itself doesn't exist."""
+        orders = {
+            '__foreign_keys__': {
+                'customer_id': fk_target
+            },
+            'id': 'integer'
+        }
+        if fk_field_defined:
+            orders['customer_id'] = 'foreign_key'
         schemas = {
-            'orders': {
-                '__foreign_keys__': {
-                    'customer_id': ('customer', 'id')  # Wrong name
-                },
+            'customers': {
                 'id': 'integer',
-                'customer_id': 'foreign_key'
-            }
+                'name': 'text'
+            },
+            'orders': orders
         }
         
-        errors, warnings = self.validator.validate_foreign_keys(
+        errors, warnings = fk_validator.validate_foreign_keys(
             'orders', schemas['orders'], schemas
         )
         
         assert len(errors) > 0
-        assert any('customer' in str(e).lower() for e in errors)
+        assert expected_error_substring in _lowered(errors)
+    
+    def test_naming_convention_variations(self, fk_validator):
+        """Should accept '<name>_id' variations and 'id', and reject other names."""
+        check = fk_validator._is_naming_convention_likely_valid
+        
+        assert check('category_id', 'categories')
+        assert check('Customers_id', 'Customers')
+        assert check('id', 'customers')
+        assert check('owner_id', 'users')
+        assert not check('cust_fk', 'customers')
+    
+    def test_suggests_close_schema_names(self, fk_validator):
+        """Should suggest schema names for typos, preferring case-insensitive matches."""
+        candidates = ['Customers', 'Orders', 'Products']
+        
+        assert fk_validator._find_similar_schema_names('custmers', candidates) == ['Customers']
+        assert fk_validator._find_similar_schema_names('ORDERS', candidates) == ['Orders']
+        assert fk_validator._find_similar_schema_names('invoices', candidates) == []
+    
+    def test_suggests_substring_field_names_on_wide_schemas(self, fk_validator):
+        """Should fall back to substring matches, in schema order, on wide schemas."""
+        candidates = tuple(f'col_{i}' for i in range(200)) + (
+            'billing_address_line', 'id', 'address', 'line_items_total_count'
+        )
+        
+        assert fk_validator._find_similar_field_names('mailing_address_of_the_customer', candidates) == ['address']
+        assert fk_validator._find_similar_field_names('line', candidates) == [
+            'billing_address_line', 'line_items_total_count'
+        ]
+        assert fk_validator._find_similar_field_names('id', candidates) == ['id']
     
-    def test_missing_target_column(self):
-        """Should error when FK references non-existent column."""
+    def test_prebuilt_schema_index(self, fk_validator):
+        """Should give the same result with a precomputed schema index."""
         schemas = {
-            'customers': {
-                'id': 'integer',
-                'name': 'text'
-            },
+            'customers': {'__table_description__': 'Customers', 'id': 'integer', 'customer_name': 'text'},
             'orders': {
-                '__foreign_keys__': {
-                    'customer_id': ('customers', 'customer_id')  # Wrong column
-                },
+                '__foreign_keys__': {'customer_id': ('customers', 'customer')},
                 'id': 'integer',
                 'customer_id': 'foreign_key'
             }
         }
+        index = _build_schema_index(schemas)
         
-        errors, warnings = self.validator.validate_foreign_keys(
-            'orders', schemas['orders'], schemas
-        )
+        with_index = fk_validator.validate_foreign_keys('orders', schemas['orders'], schemas, index)
+        without_index = fk_validator.validate_foreign_keys('orders', schemas['orders'], schemas)
         
-        assert len(errors) > 0
-        assert any('column' in str(e).lower() for e in errors)
+        assert index['customers']['public'] == ('id', 'customer_name')
+        assert ('customers', 'customer_name') in _build_fk_targets(index)
+        assert with_index == without_index
+        assert any("customers.customer_name" in e for e in with_index[0])
     
-    def test_naming_convention_warning(self):
-        """Should warn for non-standard FK naming."""
+    def test_schema_index_parses_foreign_keys_once(self, fk_validator):
+        """Should normalize tuple, dict and malformed FK definitions in the index."""
         schemas = {
-            'customers': {
-                'id': 'integer',
-                'name': 'text'
-            },
+            'customers': {'id': 'integer'},
             'orders': {
                 '__foreign_keys__': {
-                    'cust_fk': ('customers', 'id')  # Non-standard name
+                    'customer_id': ('customers', 'id'),
+                    'buyer_id': {'target_schema': 'customers', 'target_column': 'id'},
+                    'broken_id': 'customers.id'
                 },
-                'id': 'integer',
-                'cust_fk': 'foreign_key'
+                'customer_id': 'foreign_key',
+                'buyer_id': 'foreign_key',
+                'broken_id': 'foreign_key'
             }
         }
+        index = _build_schema_index(schemas)
         
-        errors, warnings = self.validator.validate_foreign_keys(
-            'orders', schemas['orders'], schemas
-        )
-        
-        assert len(errors) == 0
-        assert len(warnings) > 0
-        assert any('naming convention' in str(w).lower() for w in warnings)
+        assert [target for _, _, target in index['orders']['fks']] == [
+            ('customers', 'id'), ('customers', 'id'), None
+        ]
+        assert index['customers']['fks'] == ()
+        errors, _ = fk_validator.validate_foreign_keys('orders', schemas['orders'], schemas, index)
+        assert errors == ["FK: Invalid foreign key definition for 'broken_id': customers.id"]
     
-    def test_missing_fk_field_in_schema(self):
-        """Should error when FK field not defined in schema."""
+    def test_naming_convention_warning(self, fk_validator):
+        """Should warn for non-standard FK naming."""
         schemas = {
             'customers': {
-                'id': 'integer'
+                'id': 'integer',
+                'name': 'text'
             },
             'orders': {
                 '__foreign_keys__': {
-                    'customer_id': ('customers', 'id')
+                    'cust_fk': ('customers', 'id')  # Non-standard name
                 },
-                'id': 'integer'
-                # customer_id not defined here
+                'id': 'integer',
+                'cust_fk': 'foreign_key'
             }
         }
         
-        errors, warnings = self.validator.validate_foreign_keys(
+        errors, warnings = fk_validator.validate_foreign_keys(
             'orders', schemas['orders'], schemas
         )
         
-        assert len(errors) > 0
-        assert any('not defined' in str(e).lower() for e in errors)
+        assert len(errors) == 0
+        assert len(warnings) > 0
+        assert 'naming convention' in _lowered(warnings)
 
 
 class TestTemplateValidator:
     """Test cases for TemplateValidator."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = TemplateValidator()
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def teardown_method(self):
-        """Clean up temp files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self, tmp_path):
+        """Set up the temp directory; pytest creates and cleans it up."""
+        self.tmp_path = tmp_path
     
-    def test_missing_template_file(self):
+    def test_missing_template_file(self, template_validator):
         """Should error when template file doesn't exist."""
         schema = {
             '__template_source__': '/nonexistent/path/template.html',
@@ -158,15 +224,15 @@ class TestTemplateValidator:
             'name': 'text'
         }
         
-        errors, warnings = self.validator.validate_templates('invoice', schema)
+        errors, warnings = template_validator.validate_templates('invoice', schema)
         
         assert len(errors) > 0
-        assert any('not found' in str(e).lower() for e in errors)
+        assert 'not found' in _lowered(errors)
     
-    def test_missing_placeholder_in_schema(self):
+    def test_missing_placeholder_in_schema(self, template_validator):
         """Should error when template has placeholder not in schema."""
         # Create temporary template file
-        template_path = os.path.join(self.temp_dir, 'template.html')
+        template_path = str(self.tmp_path / 'template.html')
         with open(template_path, 'w') as f:
             f.write('<p>Hello {{ customer_name }}</p>')
         
@@ -178,15 +244,35 @@ class TestTemplateValidator:
             # customer_name not in schema
         }
         
-        errors, warnings = self.validator.validate_templates('invoice', schema)
+        errors, warnings = template_validator.validate_templates('invoice', schema)
         
         assert len(errors) > 0
-        assert any('customer_name' in str(e).lower() for e in errors)
+        assert 'customer_name' in _lowered(errors)
+    
+    def test_missing_placeholders_reported_in_sorted_order(self, template_validator):
+        """Should report undefined placeholders in a reproducible order."""
+        template_path = str(self.tmp_path / 'template.html')
+        with open(template_path, 'w') as f:
+            f.write('<p>{{ zip_code }} {{ amount }} {{ invoice_id }} {{ city }}</p>')
+        
+        schema = {
+            '__template_source__': template_path,
+            '__input_file_type__': 'html',
+            '__output_file_type__': 'html',
+            'invoice_id': 'text'
+        }
+        
+        errors, warnings = template_validator.validate_templates('invoice', schema)
+        
+        assert errors == [
+            f"Template: Placeholder '{{{{ {name} }}}}' is not defined in schema"
+            for name in ('amount', 'city', 'zip_code')
+        ]
     
-    def test_valid_template(self):
+    def test_valid_template(self, template_validator):
         """Should pass validation for valid template."""
         # Create temporary template file
-        template_path = os.path.join(self.temp_dir, 'template.html')
+        template_path = str(self.tmp_path / 'template.html')
         with open(template_path, 'w') as f:
             f.write('<p>Invoice: {{ invoice_id }}, Customer: {{ customer_name }}</p>')
         
@@ -198,14 +284,14 @@ class TestTemplateValidator:
             'customer_name': 'text'
         }
         
-        errors, warnings = self.validator.validate_templates('invoice', schema)
+        errors, warnings = template_validator.validate_templates('invoice', schema)
         
         assert len(errors) == 0, f"Expected no errors, got: {errors}"
     
-    def test_missing_template_metadata(self):
+    def test_missing_template_metadata(self, template_validator):
         """Should error when required template metadata is missing."""
         # Create temporary template file
-        template_path = os.path.join(self.temp_dir, 'template.html')
+        template_path = str(self.tmp_path / 'template.html')
         with open(template_path, 'w') as f:
             f.write('<p>{{ name }}</p>')
         
@@ -215,20 +301,115 @@ class TestTemplateValidator:
             'name': 'text'
         }
         
-        errors, warnings = self.validator.validate_templates('invoice', schema)
+        errors, warnings = template_validator.validate_templates('invoice', schema)
         
         assert len(errors) >= 2  # Both metadata fields missing
-        assert any('input_file_type' in str(e).lower() for e in errors)
-        assert any('output_file_type' in str(e).lower() for e in errors)
+        lowered = _lowered(errors)
+        assert 'input_file_type' in lowered
+        assert 'output_file_type' in lowered
     
-    def test_non_template_schema(self):
+    def test_only_plain_placeholders_are_required(self, template_validator):
+        """Should require {{ name }} placeholders only, not variables in tags, filters or attributes."""
+        template_path = str(self.tmp_path / 'template.html')
+        with open(template_path, 'w') as f:
+            f.write(
+                '<p>{{ customer_name }} {{ total|round(digits) }} {{ address.city }}</p>'
+                '{% if show_notes %}{{ notes }}{% endif %}'
+                '{% for item in line_items %}x{% endfor %}'
+            )
+        
+        schema = {
+            '__template_source__': template_path,
+            '__input_file_type__': 'html',
+            '__output_file_type__': 'html',
+            'customer_name': 'text',
+            'notes': 'text'
+        }
+        
+        errors, warnings = template_validator.validate_templates('invoice', schema)
+        
+        assert errors == []
+        assert warnings == []
+    
+    def test_invalid_jinja_syntax(self, template_validator):
+        """Should report syntax errors and still check regex placeholders."""
+        template_path = str(self.tmp_path / 'template.html')
+        with open(template_path, 'w') as f:
+            f.write('<p>{{ name }}</p>{% if %}')
+        
+        schema = {
+            '__template_source__': template_path,
+            '__input_file_type__': 'html',
+            '__output_file_type__': 'html',
+            'name': 'text'
+        }
+        
+        errors, warnings = template_validator.validate_templates('invoice', schema)
+        
+        assert len(errors) == 1
+        assert 'invalid jinja2 syntax' in errors[0].lower()
+    
+    def test_relative_template_path_from_another_directory(self, template_validator, monkeypatch):
+        """Should read the file a relative path points to from the current directory."""
+        for folder, placeholder in (('a', 'name'), ('b', 'nope')):
+            (self.tmp_path / folder).mkdir()
+            template = self.tmp_path / folder / 'template.html'
+            template.write_text(f'<p>{{{{ {placeholder} }}}}</p>')
+            os.utime(template, ns=(0, 0))
+        
+        schema = {
+            '__template_source__': 'template.html',
+            '__input_file_type__': 'html',
+            '__output_file_type__': 'html',
+            'name': 'text'
+        }
+        
+        monkeypatch.chdir(self.tmp_path / 'a')
+        assert template_validator.validate_templates('report', schema)[0] == []
+        monkeypatch.chdir(self.tmp_path / 'b')
+        assert 'nope' in _lowered(template_validator.validate_templates('report', schema)[0])
+    
+    def test_template_reread_after_edit(self, template_validator):
+        """Should pick up template edits despite caching the parsed file."""
+        template_path = str(self.tmp_path / 'template.html')
+        with open(template_path, 'w') as f:
+            f.write('<p>{{ name }}</p>')
+        schema = {
+            '__template_source__': template_path,
+            '__input_file_type__': 'html',
+            '__output_file_type__': 'html',
+            'name': 'text'
+        }
+        
+        assert template_validator.validate_templates('invoice', schema)[0] == []
+        
+        with open(template_path, 'w') as f:
+            f.write('<p>{{ name }} {{ missing_field }}</p>')
+        
+        errors, warnings = template_validator.validate_templates('invoice', schema)
+        assert any('missing_field' in e for e in errors)
+    
+    def test_template_path_is_directory(self, template_validator):
+        """Should error when the template source is not a file."""
+        schema = {
+            '__template_source__': str(self.tmp_path),
+            '__input_file_type__': 'html',
+            '__output_file_type__': 'html',
+            'name': 'text'
+        }
+        
+        errors, warnings = template_validator.validate_templates('invoice', schema)
+        
+        assert any('is not a file' in e for e in errors)
+    
+    def test_non_template_schema(self, template_validator):
         """Should skip validation for non-template schemas."""
         schema = {
             'id': 'integer',
             'name': 'text'
         }
         
-        errors, warnings = self.validator.validate_templates('customer', schema)
+        errors, warnings = template_validator.validate_templates('customer', schema)
         
         assert len(errors) == 0
         assert len(warnings) == 0
@@ -237,11 +418,72 @@ class TestTemplateValidator:
 class TestConstraintValidator:
     """Test cases for ConstraintValidator."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = ConstraintValidator()
+    def test_paired_constraints_reported_once(self, constraint_validator):
+        """Should run each range check once per field and report all constraint errors."""
+        schema = {
+            'code': {
+                'type': 'text',
+                'constraints': {
+                    'min': 10,
+                    'max': 1,
+                    'min_length': 5,
+                    'max_length': 2,
+                    'pattern': '[unclosed'
+                }
+            }
+        }
+        
+        errors, warnings = constraint_validator.validate_constraints('product', schema)
+        
+        assert len(errors) == 3
+        assert "min (10.0) > max (1.0)" in errors[0]
+        assert "invalid regex pattern" in errors[1]
+        assert "min_length (5) > max_length (2)" in errors[2]
+    
+    def test_constraint_errors_in_fixed_order(self, constraint_validator):
+        """Should report range, pattern and length errors in that order, whatever the key order."""
+        schema = {
+            'code': {
+                'type': 'text',
+                'constraints': {
+                    'max_length': 2,
+                    'pattern': '[a',
+                    'max': 1,
+                    'min_length': 5,
+                    'min': 9
+                }
+            }
+        }
+        
+        errors, warnings = constraint_validator.validate_constraints('product', schema)
+        
+        assert len(errors) == 3
+        assert "min (9.0) > max (1.0)" in errors[0]
+        assert "invalid regex pattern" in errors[1]
+        assert "min_length (5) > max_length (2)" in errors[2]
+    
+    def test_unpaired_range_constraint_is_ignored(self, constraint_validator):
+        """Should not check a range when only one bound is given."""
+        schema = {'price': {'type': 'number', 'constraints': {'min': 'abc'}}}
+        
+        errors, warnings = constraint_validator.validate_constraints('product', schema)
+        
+        assert errors == []
     
-    def test_invalid_numeric_range(self):
+    def test_none_range_bound_is_invalid(self, constraint_validator):
+        """Should report an explicit None bound as invalid, not treat it as missing."""
+        schema = {
+            'price': {'type': 'number', 'constraints': {'min': None, 'max': 5}},
+            'code': {'type': 'text', 'constraints': {'min_length': 1, 'max_length': None}}
+        }
+        
+        errors, warnings = constraint_validator.validate_constraints('product', schema)
+        
+        assert len(errors) == 2
+        assert "'price' has invalid numeric constraints" in errors[0]
+        assert "'code' has invalid length constraints" in errors[1]
+    
+    def test_invalid_numeric_range(self, constraint_validator):
         """Should error when min > max."""
         schema = {
             'price': {
@@ -253,12 +495,12 @@ class TestConstraintValidator:
             }
         }
         
-        errors, warnings = self.validator.validate_constraints('product', schema)
+        errors, warnings = constraint_validator.validate_constraints('product', schema)
         
         assert len(errors) > 0
         assert any('min' in str(e).lower() and 'max' in str(e).lower() for e in errors)
     
-    def test_invalid_regex_pattern(self):
+    def test_invalid_regex_pattern(self, constraint_validator):
         """Should error for invalid regex patterns."""
         schema = {
             'sku': {
@@ -269,12 +511,13 @@ class TestConstraintValidator:
             }
         }
         
-        errors, warnings = self.validator.validate_constraints('product', schema)
+        errors, warnings = constraint_validator.validate_constraints('product', schema)
         
         assert len(errors) > 0
-        assert any('regex' in str(e).lower() or 'pattern' in str(e).lower() for e in errors)
+        lowered = _lowered(errors)
+        assert 'regex' in lowered or 'pattern' in lowered
     
-    def test_invalid_string_length_range(self):
+    def test_invalid_string_length_range(self, constraint_validator):
         """Should error when min_length > max_length."""
         schema = {
             'name': {
@@ -286,12 +529,12 @@ class TestConstraintValidator:
             }
         }
         
-        errors, warnings = self.validator.validate_constraints('product', schema)
+        errors, warnings = constraint_validator.validate_constraints('product', schema)
         
         assert len(errors) > 0
-        assert any('length' in str(e).lower() for e in errors)
+        assert 'length' in _lowered(errors)
     
-    def test_valid_constraints(self):
+    def test_valid_constraints(self, constraint_validator):
         """Should pass validation for valid constraints."""
         schema = {
             'price': {
@@ -311,34 +554,172 @@ class TestConstraintValidator:
             }
         }
         
-        errors, warnings = self.validator.validate_constraints('product', schema)
+        errors, warnings = constraint_validator.validate_constraints('product', schema)
         
         assert len(errors) == 0, f"Expected no errors, got: {errors}"
     
-    def test_unknown_field_type_warning(self):
+    def test_unknown_field_type_warning(self, constraint_validator):
         """Should warn for unknown field types."""
         schema = {
             'custom_field': 'unknown_type'
         }
         
-        errors, warnings = self.validator.validate_constraints('product', schema)
+        errors, warnings = constraint_validator.validate_constraints('product', schema)
         
         assert len(warnings) > 0
-        assert any('unknown' in str(w).lower() or 'type' in str(w).lower() for w in warnings)
+        lowered = _lowered(warnings)
+        assert 'unknown' in lowered or 'type' in lowered
+    
+    def test_validate_column_returns_non_matching_indices(self, constraint_validator):
+        """Should return the positions of values that don't match the pattern."""
+        values = ['ABC-12345', 'abc-12345', None, 'XYZ-00001', 'XYZ-1']
+        
+        invalid = constraint_validator.validate_column(values, '^[A-Z]{3}-[0-9]{5}$')
+        
+        assert invalid == [1, 4]
+    
+    def test_validate_column_bounds_numeric(self, constraint_validator):
+        """Should return indices of values outside min/max, skipping None."""
+        violations = constraint_validator.validate_column_bounds(
+            [5, 150, None, -1, 0, 120], {'min': 0, 'max': 120}
+        )
+        assert violations == [1, 3]
+    
+    def test_validate_column_bounds_length(self, constraint_validator):
+        """Should return indices of strings outside min_length/max_length."""
+        violations = constraint_validator.validate_column_bounds(
+            ['ab', 'abcdef', None, 'abcd'], {'min_length': 3, 'max_length': 5}
+        )
+        assert violations == [0, 1]
+    
+    def test_validate_column_bounds_non_numeric(self, constraint_validator):
+        """Should raise ValueError for non-numeric values under min/max."""
+        with pytest.raises(ValueError, match="non-numeric"):
+            constraint_validator.validate_column_bounds(['abc'], {'min': 0})
+    
+    @pytest.mark.skipif(not validators.HYPERSCAN_INSTALLED, reason="hyperscan not installed")
+    @pytest.mark.parametrize("pattern", [r'^\w+$', r'^.{3}$', r'^\w+ \w+$', r'^[A-Z]{3}-[0-9]{5}$'])
+    def test_validate_column_hyperscan_matches_re(self, constraint_validator, monkeypatch, pattern):
+        """Should give the same result with Hyperscan as with re, including non-ASCII values."""
+        values = ['José', 'héé', 'abc', 'Zoë Müller', 'ABC-12345', 'a-b', '']
+        
+        with_hyperscan = constraint_validator.validate_column(values, pattern)
+        monkeypatch.setattr(validators, 'HYPERSCAN_INSTALLED', False)
+        
+        assert with_hyperscan == constraint_validator.validate_column(values, pattern)
+    
+    def test_validate_column_invalid_pattern(self, constraint_validator):
+        """Should raise for an invalid regex pattern."""
+        with pytest.raises(ValueError, match="Invalid regex pattern"):
+            constraint_validator.validate_column(['a'], '[unclosed')
+
+
+class TestCircularDependencyValidator:
+    """Test cases for CircularDependencyValidator."""
+    
+    @staticmethod
+    def _chain(length):
+        schemas = {'level0': {'id': 'integer'}}
+        for i in range(1, length):
+            schemas[f'level{i}'] = {
+                '__foreign_keys__': {'parent_id': (f'level{i - 1}', 'id')},
+                'id': 'integer',
+                'parent_id': 'foreign_key'
+            }
+        return schemas
+    
+    def test_cycle_reported_once(self, circular_validator):
+        """Should report a cycle only under the first of its schemas."""
+        schemas = {
+            'a': {'__foreign_keys__': {'b_id': ('b', 'id')}, 'b_id': 'foreign_key'},
+            'b': {'__foreign_keys__': {'c_id': ('c', 'id')}, 'c_id': 'foreign_key'},
+            'c': {'__foreign_keys__': {'a_id': ('a', 'id')}, 'a_id': 'foreign_key'},
+            'd': {'id': 'integer'}
+        }
+        
+        errors = {name: circular_validator.validate_circular_dependencies(name, schema, schemas)[0]
+                  for name, schema in schemas.items()}
+        
+        assert errors['a'] == ["Circular dependency detected: a → b → c → a"]
+        assert errors['b'] == errors['c'] == errors['d'] == []
+    
+    def test_prebuilt_graph_and_cycles(self, circular_validator):
+        """Should give the same result with a graph and cycles computed once."""
+        schemas = {
+            'a': {'__foreign_keys__': {'b_id': ('b', 'id')}, 'b_id': 'foreign_key'},
+            'b': {'__foreign_keys__': {'a_id': ('a', 'id')}, 'a_id': 'foreign_key'},
+            'c': {'__foreign_keys__': {'a_id': ('a', 'id')}, 'a_id': 'foreign_key'}
+        }
+        
+        graph = circular_validator.build_graph(schemas)
+        cycles = circular_validator.detect_cycles(graph)
+        
+        assert graph == {'a': ['b'], 'b': ['a'], 'c': ['a']}
+        assert cycles == [['a', 'b']]
+        for name, schema in schemas.items():
+            assert circular_validator.validate_circular_dependencies(
+                name, schema, schemas, graph=graph, cycles=cycles
+            ) == circular_validator.validate_circular_dependencies(name, schema, schemas)
+    
+    def test_self_reference_is_a_cycle(self, circular_validator):
+        """Should report a schema that references itself."""
+        schemas = {'employees': {'__foreign_keys__': {'manager_id': ('employees', 'id')}, 'id': 'integer'}}
+        
+        errors, warnings = circular_validator.validate_circular_dependencies(
+            'employees', schemas['employees'], schemas
+        )
+        
+        assert errors == ["Circular dependency detected: employees → employees"]
+    
+    def test_deep_chain_warning(self, circular_validator):
+        """Should warn for dependencies deeper than max_depth."""
+        schemas = self._chain(13)
+        
+        errors, warnings = circular_validator.validate_circular_dependencies(
+            'level12', schemas['level12'], schemas, max_depth=10
+        )
+        
+        assert errors == []
+        assert len(warnings) == 2  # level1 (depth 11) and level0 (depth 12)
+    
+    def test_dependency_heights(self, circular_validator):
+        """Should give the longest chain per schema, and infinity through cycles."""
+        schemas = self._chain(4)
+        schemas['loop'] = {'__foreign_keys__': {'loop_id': ('loop', 'id')}, 'id': 'integer'}
+        schemas['uses_loop'] = {'__foreign_keys__': {'loop_id': ('loop', 'id')}, 'id': 'integer'}
+        
+        graph = circular_validator.build_graph(schemas)
+        heights = circular_validator.dependency_heights(graph)
+        
+        assert [heights[f'level{i}'] for i in range(4)] == [0, 1, 2, 3]
+        assert heights['loop'] == heights['uses_loop'] == float('inf')
+        assert circular_validator.analyze_graph(graph) == (
+            circular_validator.detect_cycles(graph), heights
+        )
+        for name, schema in schemas.items():
+            assert circular_validator.validate_circular_dependencies(
+                name, schema, schemas, max_depth=1, graph=graph, heights=heights
+            ) == circular_validator.validate_circular_dependencies(name, schema, schemas, max_depth=1)
+    
+    def test_long_chain_does_not_recurse(self, circular_validator):
+        """Should handle dependency chains longer than the recursion limit."""
+        schemas = self._chain(sys.getrecursionlimit() + 100)
+        
+        errors, warnings = circular_validator.validate_circular_dependencies(
+            'level0', schemas['level0'], schemas
+        )
+        
+        assert errors == []
 
 
 class TestSchemaValidator:
     """Test cases for main SchemaValidator."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self, tmp_path):
+        """Set up test fixtures; pytest creates and cleans up the temp directory."""
         self.validator = SchemaValidator()
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def teardown_method(self):
-        """Clean up temp files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.tmp_path = tmp_path
     
     def test_valid_schemas(self):
         """Should validate correct schema definitions."""
@@ -363,6 +744,20 @@ class TestSchemaValidator:
         assert result.is_valid
         assert result.error_count == 0
     
+    def test_no_foreign_keys_skips_dependency_graph(self, monkeypatch):
+        """Should not build the dependency graph when no schema has foreign keys."""
+        build_graph = MagicMock()
+        monkeypatch.setattr(self.validator.circular_validator, 'build_graph', build_graph)
+        schemas = {
+            'customers': {'id': 'integer', 'name': 'text'},
+            'products': {'id': 'integer', 'price': 'number'}
+        }
+        
+        result = self.validator.validate_schemas(schemas)
+        
+        assert result.is_valid
+        build_graph.assert_not_called()
+    
     def test_empty_schemas(self):
         """Should error for empty schemas."""
         schemas = {}
@@ -372,6 +767,12 @@ class TestSchemaValidator:
         assert not result.is_valid
         assert result.error_count > 0
     
+    def test_schema_that_is_not_a_dict(self):
+        """Should error with the type name for schemas that aren't dictionaries."""
+        result = self.validator.validate_schemas({'orders': ['id', 'total']})
+        
+        assert result.errors['orders'] == ["Schema must be a dictionary, got list"]
+    
     def test_schema_with_no_fields(self):
         """Should error for schema with only metadata."""
         schemas = {
@@ -385,7 +786,7 @@ class TestSchemaValidator:
         result = self.validator.validate_schemas(schemas)
         
         assert not result.is_valid
-        assert any('at least one' in str(e).lower() for errors in result.errors.values() for e in errors)
+        assert result.contains_error('at least one')
     
     def test_multiple_validation_errors(self):
         """Should report all validation errors."""
@@ -404,6 +805,92 @@ class TestSchemaValidator:
         assert not result.is_valid
         assert result.error_count >= 2
     
+    def test_fail_fast_stops_at_first_failing_schema(self):
+        """Should stop validating once a check reports an error."""
+        schemas = {
+            'orders': {
+                '__foreign_keys__': {'customer_id': ('customer', 'id')},
+                'id': 'integer'
+            },
+            'products': {
+                'price': {'type': 'number', 'constraints': {'min': 10, 'max': 1}}
+            }
+        }
+        
+        fast = self.validator.validate_schemas(schemas, fail_fast=True)
+        full = self.validator.validate_schemas(schemas)
+        
+        assert not fast.is_valid
+        assert set(full.errors) == {'orders', 'products'}
+        assert list(fast.errors) == ['orders']
+    
+    def test_plain_schema_skips_fk_and_template_checks(self):
+        """Should not run FK, template or cycle checks on schemas without them."""
+        self.validator.fk_validator = MagicMock()
+        self.validator.template_validator = MagicMock()
+        self.validator.circular_validator = MagicMock()
+        
+        result = self.validator.validate_schemas({'plain_users': {'id': 'integer', 'nickname': 'text'}})
+        
+        assert result.is_valid
+        self.validator.fk_validator.validate_foreign_keys.assert_not_called()
+        self.validator.template_validator.validate_templates.assert_not_called()
+        self.validator.circular_validator.validate_circular_dependencies.assert_not_called()
+    
+    def test_fail_fast_valid_schemas(self):
+        """Should still report valid schemas as valid."""
+        schemas = {'users': {'id': 'integer', 'name': 'text'}}
+        
+        result = self.validator.validate_schemas(schemas, fail_fast=True)
+        
+        assert result.is_valid
+    
+    def test_large_schema_set_matches_serial_validation(self, monkeypatch):
+        """Should report the same results, in schema order, when reading templates from a thread pool."""
+        schemas = {'customers': {'id': 'integer', 'name': 'text'}}
+        for i in range(12):
+            schemas[f'orders_{i}'] = {
+                '__foreign_keys__': {'customer_id': ('customer' if i % 3 == 0 else 'customers', 'id')},
+                'id': 'integer',
+                'customer_id': 'foreign_key'
+            }
+        schemas['empty'] = {'__description__': 'no fields'}
+        for i in range(3):
+            template_path = str(self.tmp_path / f'report_{i}.html')
+            with open(template_path, 'w') as f:
+                f.write('<p>{{ name }} {{ missing_%d }}</p>' % i)
+            schemas[f'report_{i}'] = {
+                '__template__': True,
+                '__template_source__': template_path,
+                '__input_file_type__': 'html',
+                '__output_file_type__': 'pdf',
+                'name': 'text'
+            }
+        
+        parallel = self.validator._validate_schemas(schemas, strict=False)
+        monkeypatch.setattr(validators, 'PARALLEL_VALIDATION_THRESHOLD', len(schemas) + 1)
+        serial = self.validator._validate_schemas(schemas, strict=False)
+        
+        assert not parallel.is_valid
+        assert list(parallel.errors) == list(serial.errors)
+        assert parallel.errors == serial.errors
+        assert parallel.warnings == serial.warnings
+        assert parallel.suggestions == serial.suggestions
+    
+    def test_parallel_option_gives_same_result(self):
+        """Should give the same result with the thread pool forced on or off."""
+        schemas = {
+            'customers': {'id': 'integer'},
+            'orders': {'__foreign_keys__': {'customer_id': ('customer', 'id')}, 'customer_id': 'foreign_key'}
+        }
+        
+        forced = self.validator._validate_schemas(schemas, strict=False, parallel=True)
+        serial = self.validator._validate_schemas(schemas, strict=False, parallel=False)
+        
+        assert not forced.is_valid
+        assert forced.errors == serial.errors
+        assert forced.warnings == serial.warnings
+    
     def test_strict_mode_converts_warnings_to_errors(self):
         """Should convert warnings to errors in strict mode."""
         schemas = {
@@ -455,7 +942,87 @@ class TestSchemaValidator:
         # Should detect the circular dependency
         assert not result.is_valid
         assert result.error_count > 0
-        assert any('circular' in str(e).lower() for errors in result.errors.values() for e in errors)
+        assert result.contains_error('circular')
+    
+    def test_cached_result_is_independent_copy(self):
+        """Should return equal but independent results for repeated validation."""
+        schemas = {
+            'orders': {
+                '__foreign_keys__': {'customer_id': ('customers', 'id')},
+                'id': 'integer',
+                'customer_id': 'foreign_key'
+            }
+        }
+        
+        first = self.validator.validate_schemas(schemas)
+        first.add_error('orders', 'modified by caller')
+        second = self.validator.validate_schemas(schemas)
+        
+        assert second.error_count == first.error_count - 1
+        assert 'modified by caller' not in second.errors['orders']
+    
+    def test_cache_not_shared_between_validators(self):
+        """Should not serve one validator's cached result to another, or after a sub-validator is replaced."""
+        schemas = {'customers': {'id': 'integer', 'name': 'text'}}
+        self.validator.validate_schemas(schemas)
+        
+        other = SchemaValidator()
+        other.constraint_validator = MagicMock()
+        other.constraint_validator.validate_constraints.return_value = ([], [])
+        other.validate_schemas(schemas)
+        other.constraint_validator.validate_constraints.assert_called_once()
+        
+        self.validator.constraint_validator = MagicMock()
+        self.validator.constraint_validator.validate_constraints.return_value = (['replaced'], [])
+        assert self.validator.validate_schemas(schemas).errors == {'customers': ['replaced']}
+    
+    def test_cache_resolves_relative_template_paths(self, monkeypatch):
+        """Should re-validate a relative template path from another working directory."""
+        for folder, placeholder in (('a', 'name'), ('b', 'nope')):
+            (self.tmp_path / folder).mkdir()
+            template = self.tmp_path / folder / 'template.html'
+            template.write_text(f'<p>{{{{ {placeholder} }}}}</p>')
+            os.utime(template, ns=(0, 0))
+        
+        schemas = {
+            'report': {
+                '__template__': True,
+                '__template_source__': 'template.html',
+                '__input_file_type__': 'html',
+                '__output_file_type__': 'pdf',
+                'name': 'text'
+            }
+        }
+        
+        monkeypatch.chdir(self.tmp_path / 'a')
+        assert self.validator.validate_schemas(schemas).is_valid
+        monkeypatch.chdir(self.tmp_path / 'b')
+        assert not self.validator.validate_schemas(schemas).is_valid
+    
+    def test_cache_invalidated_when_template_changes(self):
+        """Should re-validate when a referenced template file changes."""
+        template_path = str(self.tmp_path / 'template.html')
+        with open(template_path, 'w') as f:
+            f.write('<p>{{ name }}</p>')
+        
+        schemas = {
+            'report': {
+                '__template__': True,
+                '__template_source__': template_path,
+                '__input_file_type__': 'html',
+                '__output_file_type__': 'pdf',
+                'name': 'text'
+            }
+        }
+        
+        assert self.validator.validate_schemas(schemas).is_valid
+        
+        with open(template_path, 'w') as f:
+            f.write('<p>{{ name }} {{ missing_field }}</p>')
+        os.utime(template_path, ns=(0, 0))
+        
+        result = self.validator.validate_schemas(schemas)
+        assert not result.is_valid
 
 
 class TestValidationResult:
@@ -482,6 +1049,66 @@ class TestValidationResult:
         assert result.warning_count == 1
         assert 'schema1' in result.warnings
     
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10+")
+    def test_uses_slots(self):
+        """Should not carry a per-instance __dict__."""
+        result = ValidationResult()
+        
+        assert not hasattr(result, '__dict__')
+        with pytest.raises(AttributeError):
+            result.unexpected_attribute = True
+    
+    def test_contains_error(self):
+        """Should find error text case-insensitively, including errors passed to the constructor."""
+        result = ValidationResult(errors={'schema1': ['Field NOT FOUND']})
+        result.add_error('schema2', 'Circular dependency detected: a → b → a')
+        result.add_errors('schema2', ['Template: File not found'])
+        
+        assert result.contains_error('not found')
+        assert result.contains_error('CIRCULAR')
+        assert result.contains_error('template: file')
+        assert not result.contains_error('naming convention')
+        assert not ValidationResult().contains_error('anything')
+        
+        # Errors changed directly on the public dict are seen too
+        result.errors['schema3'] = ['Naming convention mismatch']
+        result.errors['schema1'].clear()
+        assert result.contains_error('naming convention')
+        assert result.contains_error('not found')  # still in schema2
+        del result.errors['schema2']
+        assert not result.contains_error('not found')
+    
+    def test_add_errors_and_warnings_in_bulk(self):
+        """Should add several messages at once and update the counts."""
+        result = ValidationResult()
+        
+        result.add_errors('schema1', ['Error 1', 'Error 2'])
+        result.add_warnings('schema1', ['Warning 1'])
+        result.add_errors('schema1', ['Error 3'])
+        
+        assert not result.is_valid
+        assert result.error_count == 3
+        assert result.warning_count == 1
+        assert result.errors['schema1'] == ['Error 1', 'Error 2', 'Error 3']
+    
+    def test_promote_warnings_to_errors(self):
+        """Should move every warning into the errors with a strict mode marker."""
+        result = ValidationResult()
+        result.add_error('schema1', 'Error 1')
+        result.add_warnings('schema1', ['Warning 1'])
+        result.add_warning('schema2', 'Warning 2')
+        
+        result.promote_warnings_to_errors()
+        
+        assert not result.is_valid
+        assert result.error_count == 3
+        assert result.warning_count == 0
+        assert result.warnings == {}
+        assert result.errors == {
+            'schema1': ['Error 1', '(Strict mode) Warning 1'],
+            'schema2': ['(Strict mode) Warning 2']
+        }
+    
     def test_add_suggestion(self):
         """Should add suggestions."""
         result = ValidationResult()
@@ -491,6 +1118,15 @@ class TestValidationResult:
         
         assert len(result.suggestions) == 1  # Should not add duplicates
     
+    def test_add_suggestion_dedups_initial_suggestions(self):
+        """Should not duplicate suggestions passed to the constructor."""
+        result = ValidationResult(suggestions=['Fix this issue'])
+        
+        result.add_suggestion('Fix this issue')
+        result.add_suggestion('Fix that issue')
+        
+        assert result.suggestions == ['Fix this issue', 'Fix that issue']
+    
     def test_summary_formatting(self):
         """Should format summary correctly."""
         result = ValidationResult()
@@ -506,5 +1142,15 @@ class TestValidationResult:
         assert 'Suggestion 1' in summary
 
 
+def test_validators_import_does_not_load_generator():
+    """Importing syda for validation only should not load the generator or provider SDKs."""
+    code = (
+        "import sys; from syda import SchemaValidator; "
+        "print('syda.generate' in sys.modules, 'openai' in sys.modules)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert output.stdout.split() == ["False", "False"]
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
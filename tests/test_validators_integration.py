@@ -4,8 +4,9 @@ Tests the full validation workflow during generation.
 """
 
 import pytest
-import tempfile
-import os
+from unittest.mock import MagicMock
+
+from syda import validators
 from syda.validators import SchemaValidator, ValidationResult
 
 
@@ -75,56 +76,49 @@ class TestValidationIntegration:
         assert result.error_count == 0
         assert result.warning_count == 0
     
-    def test_healthcare_schema_with_templates(self):
+    def test_healthcare_schema_with_templates(self, tmp_path):
         """Should validate healthcare schema with document templates."""
         validator = SchemaValidator()
         
-        temp_dir = tempfile.mkdtemp()
-        
-        try:
-            # Create template file
-            template_path = os.path.join(temp_dir, 'medical_report.html')
-            with open(template_path, 'w') as f:
-                f.write('''
-                <html>
-                    <h1>Medical Report</h1>
-                    <p>Patient: {{ patient_name }}</p>
-                    <p>DOB: {{ date_of_birth }}</p>
-                    <p>Diagnosis: {{ diagnosis }}</p>
-                    <p>Prescribed Date: {{ prescribed_date }}</p>
-                </html>
-                ''')
-            
-            schemas = {
-                'patients': {
-                    'id': 'integer',
-                    'name': 'text',
-                    'email': 'email',
-                    'phone': 'phone'
-                },
-                'medical_reports': {
-                    '__template_source__': template_path,
-                    '__input_file_type__': 'html',
-                    '__output_file_type__': 'pdf',
-                    'patient_id': 'foreign_key',
-                    'patient_name': 'text',
-                    'date_of_birth': 'date',
-                    'diagnosis': 'text',
-                    'prescribed_date': 'date',
-                    '__foreign_keys__': {
-                        'patient_id': ('patients', 'id')
-                    }
+        # Create template file
+        template_path = str(tmp_path / 'medical_report.html')
+        with open(template_path, 'w') as f:
+            f.write('''
+            <html>
+                <h1>Medical Report</h1>
+                <p>Patient: {{ patient_name }}</p>
+                <p>DOB: {{ date_of_birth }}</p>
+                <p>Diagnosis: {{ diagnosis }}</p>
+                <p>Prescribed Date: {{ prescribed_date }}</p>
+            </html>
+            ''')
+        
+        schemas = {
+            'patients': {
+                'id': 'integer',
+                'name': 'text',
+                'email': 'email',
+                'phone': 'phone'
+            },
+            'medical_reports': {
+                '__template_source__': template_path,
+                '__input_file_type__': 'html',
+                '__output_file_type__': 'pdf',
+                'patient_id': 'foreign_key',
+                'patient_name': 'text',
+                'date_of_birth': 'date',
+                'diagnosis': 'text',
+                'prescribed_date': 'date',
+                '__foreign_keys__': {
+                    'patient_id': ('patients', 'id')
                 }
             }
-            
-            result = validator.validate_schemas(schemas)
-            
-            assert result.is_valid
-            assert result.error_count == 0
-        
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        }
+        
+        result = validator.validate_schemas(schemas)
+        
+        assert result.is_valid
+        assert result.error_count == 0
     
     def test_schema_with_multiple_errors_reports_all(self):
         """Should collect and report all validation errors."""
@@ -164,9 +158,10 @@ class TestValidationIntegration:
         for schema_errors in result.errors.values():
             all_errors.extend(schema_errors)
         
-        assert any('constraint' in str(e).lower() or 'price' in str(e).lower() for e in all_errors)
-        assert any('pattern' in str(e).lower() or 'regex' in str(e).lower() for e in all_errors)
-        assert any('product' in str(e).lower() for e in all_errors)
+        lowered = "\n".join(str(e).lower() for e in all_errors)
+        assert 'constraint' in lowered or 'price' in lowered
+        assert 'pattern' in lowered or 'regex' in lowered
+        assert 'product' in lowered
     
     def test_strict_mode_enforces_naming_conventions(self):
         """Should enforce naming conventions in strict mode."""
@@ -216,60 +211,40 @@ class TestValidationIntegration:
         assert not result.is_valid
         assert len(result.suggestions) > 0
         # Should have helpful suggestions about case sensitivity
-        assert any('case' in str(s).lower() or 'verify' in str(s).lower() for s in result.suggestions)
+        lowered = "\n".join(result.suggestions).lower()
+        assert 'case' in lowered or 'verify' in lowered
     
-    def test_validation_with_file_based_schemas(self):
-        """Should validate schemas defined in files."""
-        import json
-        
+    def test_validation_with_json_loaded_schemas(self):
+        """Should validate schemas in the form json.load returns them (FKs as lists)."""
         validator = SchemaValidator()
-        temp_dir = tempfile.mkdtemp()
         
-        try:
-            # Create JSON schema files
-            customer_schema = {
-                'id': 'integer',
-                'name': 'text',
-                'email': 'email'
-            }
-            
-            order_schema = {
-                '__foreign_keys__': {
-                    'customer_id': ['customers', 'id']
-                },
-                'id': 'integer',
-                'customer_id': 'foreign_key',
-                'total': 'number'
-            }
-            
-            customer_path = os.path.join(temp_dir, 'customer.json')
-            order_path = os.path.join(temp_dir, 'order.json')
-            
-            with open(customer_path, 'w') as f:
-                json.dump(customer_schema, f)
-            
-            with open(order_path, 'w') as f:
-                json.dump(order_schema, f)
-            
-            # Validate dict version (as if schemas were loaded)
-            schemas = {
-                'customers': customer_schema,
-                'orders': order_schema
-            }
-            
-            result = validator.validate_schemas(schemas)
-            
-            assert result.is_valid
-            assert result.error_count == 0
-        
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
-    
-    def test_large_schema_validation_performance(self):
-        """Should validate large schemas in reasonable time."""
-        import time
+        customer_schema = {
+            'id': 'integer',
+            'name': 'text',
+            'email': 'email'
+        }
+        
+        order_schema = {
+            '__foreign_keys__': {
+                'customer_id': ['customers', 'id']
+            },
+            'id': 'integer',
+            'customer_id': 'foreign_key',
+            'total': 'number'
+        }
+        
+        schemas = {
+            'customers': customer_schema,
+            'orders': order_schema
+        }
+        
+        result = validator.validate_schemas(schemas)
         
+        assert result.is_valid
+        assert result.error_count == 0
+    
+    def test_large_schema_validation_performance(self, monkeypatch):
+        """Should validate large schemas with one pass per schema and one graph analysis."""
         validator = SchemaValidator()
         
         # Create a large schema with many tables
@@ -293,14 +268,29 @@ class TestValidationIntegration:
                 }
             }
         
-        # Time the validation
-        start_time = time.time()
+        # Count how often each stage runs rather than timing it, since wall-clock
+        # time and call counts depend on the host and the optional accelerators
+        build_index = MagicMock(wraps=validators._build_schema_index)
+        monkeypatch.setattr(validators, '_build_schema_index', build_index)
+        stages = {
+            'fk': (validator.fk_validator, 'validate_foreign_keys'),
+            'constraints': (validator.constraint_validator, 'validate_constraints'),
+            'circular': (validator.circular_validator, 'validate_circular_dependencies'),
+            'graph': (validator.circular_validator, 'analyze_graph'),
+        }
+        spies = {}
+        for stage, (target, method) in stages.items():
+            spies[stage] = MagicMock(wraps=getattr(target, method))
+            monkeypatch.setattr(target, method, spies[stage])
+        
         result = validator.validate_schemas(schemas)
-        elapsed_time = time.time() - start_time
         
-        # Should complete in under 1 second
-        assert elapsed_time < 1.0
         assert result.is_valid
+        assert build_index.call_count == 1
+        assert spies['graph'].call_count == 1
+        assert spies['constraints'].call_count == len(schemas)
+        # Only the 20 tables with foreign keys need the FK and circular checks
+        assert spies['fk'].call_count == spies['circular'].call_count == 20
     
     def test_validation_result_formatting(self):
         """Should format validation results correctly."""